@@ -28,106 +28,146 @@ __author__ = "Kanishk Kumar Singh"
 __email__ = "kanishkkumar2004@gmail.com"
 __description__ = "A complete blockchain platform library with PoW/PoS consensus, smart contracts, and DeFi applications"
 
-# Export core modules
-from chainforgeledger.core.block import Block
-from chainforgeledger.core.blockchain import Blockchain
-from chainforgeledger.core.transaction import Transaction
-from chainforgeledger.core.merkle import MerkleTree
-from chainforgeledger.core.state import State
-from chainforgeledger.core.bridge import CrossChainBridge
-from chainforgeledger.core.staking import StakingPool
-from chainforgeledger.core.liquidity import LiquidityPool
-from chainforgeledger.core.fee_distribution import FeeDistributionSystem
-from chainforgeledger.core.fork import ForkHandler
-from chainforgeledger.core.sharding import ShardManager
-from chainforgeledger.core.state_pruning import StatePruner
-from chainforgeledger.core.lending import LendingPool
-from chainforgeledger.core.caching import BlockchainCache
-from chainforgeledger.core.difficulty import DifficultyAdjuster
-from chainforgeledger.core.serialization import BlockSerializer
-from chainforgeledger.core.receipt import TransactionReceipt, LogEntry, create_transaction_receipt
-from chainforgeledger.core.light_client import LightClient, BlockHeader
-from chainforgeledger.core.execution_pipeline import ExecutionPipeline, PipelineContext, create_execution_pipeline, default_plugins, LoggingPlugin, GasTrackingPlugin
-from chainforgeledger.core.block_producer import BlockProducer, ProductionOptions, ProductionResult, create_block_producer
-
-# Export consensus mechanisms
-from chainforgeledger.consensus.pow import ProofOfWork
-from chainforgeledger.consensus.pos import ProofOfStake
-from chainforgeledger.consensus.validator import Validator, ValidatorManager
-from chainforgeledger.consensus.slashing import SlashingMechanism
-from chainforgeledger.consensus.finality import FinalityManager, Checkpoint, Vote
-from chainforgeledger.consensus.interface import (
-    ConsensusInterface,
-    ProofOfWorkInterface,
-    ProofOfStakeInterface,
-    DelegatedProofOfStakeInterface,
-    PBFTInterface,
-    ConsensusFactory,
-    ConsensusManager
-)
-
-# Export runtime modules
-from chainforgeledger.runtime import (
-    EventSystem,
-    Event,
-    GasSystem,
-    GasConfig,
-    GasMetrics,
-    PluginSystem,
-    Plugin,
-    PluginInfo,
-    PluginConfig,
-    StateMachine,
-    StateSnapshot,
-    ExecutionResult
-)
-
-# Export cryptographic utilities
-from chainforgeledger.crypto.hashing import sha256_hash, keccak256_hash
-from chainforgeledger.crypto.keys import generate_keys, KeyPair
-from chainforgeledger.crypto.signature import Signature
-from chainforgeledger.crypto.wallet import Wallet
-from chainforgeledger.crypto.multisig import MultiSignature, MultiSigWallet
-from chainforgeledger.crypto.mnemonic import MnemonicGenerator
-
-# Export networking
-from chainforgeledger.networking.node import Node
-from chainforgeledger.networking.peer import Peer
-from chainforgeledger.networking.protocol import Protocol
-from chainforgeledger.networking.mempool import MemPool
-from chainforgeledger.networking.rate_limiter import RateLimiter
-
-# Export smart contracts
-from chainforgeledger.smartcontracts.vm import VirtualMachine
-from chainforgeledger.smartcontracts.compiler import Compiler
-from chainforgeledger.smartcontracts.executor import ContractExecutor
-from chainforgeledger.smartcontracts.sandbox import ContractSandbox
-
-# Export tokenomics
-from chainforgeledger.tokenomics import Tokenomics
-from chainforgeledger.tokenomics.standards import KK20Token, KK721Token, TokenFactory
-from chainforgeledger.tokenomics.native import NativeCoin
-from chainforgeledger.tokenomics.stablecoin import Stablecoin
-from chainforgeledger.tokenomics.treasury import TreasuryManager
-
-# Export governance
-from chainforgeledger.governance.proposal import Proposal
-from chainforgeledger.governance.voting import VotingSystem
-from chainforgeledger.governance.dao import DAO
-
-# Export storage
-from chainforgeledger.storage.database import Database
-from chainforgeledger.storage.leveldb import LevelDBStorage
-from chainforgeledger.storage.models import BlockStorage, TransactionStorage
-
-# Export API
-from chainforgeledger.api.server import ApiServer
-from chainforgeledger.api.routes import ApiRoutes
-
-# Export utilities
-from chainforgeledger.utils.config import Config
-from chainforgeledger.utils.crypto import CryptoUtils
-from chainforgeledger.utils.logger import get_logger, configure_global_logger, LoggerMixin
+import importlib
+
+# Exported names are imported on first access (PEP 562), so importing the
+# package only loads the submodules a program actually uses.
+_LAZY = {
+    # Export core modules
+    "Block": "chainforgeledger.core.block",
+    "Blockchain": "chainforgeledger.core.blockchain",
+    "Transaction": "chainforgeledger.core.transaction",
+    "MerkleTree": "chainforgeledger.core.merkle",
+    "State": "chainforgeledger.core.state",
+    "CrossChainBridge": "chainforgeledger.core.bridge",
+    "StakingPool": "chainforgeledger.core.staking",
+    "LiquidityPool": "chainforgeledger.core.liquidity",
+    "FeeDistributionSystem": "chainforgeledger.core.fee_distribution",
+    "ForkHandler": "chainforgeledger.core.fork",
+    "ShardManager": "chainforgeledger.core.sharding",
+    "StatePruner": "chainforgeledger.core.state_pruning",
+    "LendingPool": "chainforgeledger.core.lending",
+    "BlockchainCache": "chainforgeledger.core.caching",
+    "DifficultyAdjuster": "chainforgeledger.core.difficulty",
+    "BlockSerializer": "chainforgeledger.core.serialization",
+    "TransactionReceipt": "chainforgeledger.core.receipt",
+    "LogEntry": "chainforgeledger.core.receipt",
+    "create_transaction_receipt": "chainforgeledger.core.receipt",
+    "LightClient": "chainforgeledger.core.light_client",
+    "BlockHeader": "chainforgeledger.core.light_client",
+    "ExecutionPipeline": "chainforgeledger.core.execution_pipeline",
+    "PipelineContext": "chainforgeledger.core.execution_pipeline",
+    "create_execution_pipeline": "chainforgeledger.core.execution_pipeline",
+    "default_plugins": "chainforgeledger.core.execution_pipeline",
+    "LoggingPlugin": "chainforgeledger.core.execution_pipeline",
+    "GasTrackingPlugin": "chainforgeledger.core.execution_pipeline",
+    "BlockProducer": "chainforgeledger.core.block_producer",
+    "ProductionOptions": "chainforgeledger.core.block_producer",
+    "ProductionResult": "chainforgeledger.core.block_producer",
+    "create_block_producer": "chainforgeledger.core.block_producer",
+
+    # Export consensus mechanisms
+    "ProofOfWork": "chainforgeledger.consensus.pow",
+    "ProofOfStake": "chainforgeledger.consensus.pos",
+    "Validator": "chainforgeledger.consensus.validator",
+    "ValidatorManager": "chainforgeledger.consensus.validator",
+    "SlashingMechanism": "chainforgeledger.consensus.slashing",
+    "FinalityManager": "chainforgeledger.consensus.finality",
+    "Checkpoint": "chainforgeledger.consensus.finality",
+    "Vote": "chainforgeledger.consensus.finality",
+    "ConsensusInterface": "chainforgeledger.consensus.interface",
+    "ProofOfWorkInterface": "chainforgeledger.consensus.interface",
+    "ProofOfStakeInterface": "chainforgeledger.consensus.interface",
+    "DelegatedProofOfStakeInterface": "chainforgeledger.consensus.interface",
+    "PBFTInterface": "chainforgeledger.consensus.interface",
+    "ConsensusFactory": "chainforgeledger.consensus.interface",
+    "ConsensusManager": "chainforgeledger.consensus.interface",
+
+    # Export runtime modules
+    "EventSystem": "chainforgeledger.runtime",
+    "Event": "chainforgeledger.runtime",
+    "GasSystem": "chainforgeledger.runtime",
+    "GasConfig": "chainforgeledger.runtime",
+    "GasMetrics": "chainforgeledger.runtime",
+    "PluginSystem": "chainforgeledger.runtime",
+    "Plugin": "chainforgeledger.runtime",
+    "PluginInfo": "chainforgeledger.runtime",
+    "PluginConfig": "chainforgeledger.runtime",
+    "StateMachine": "chainforgeledger.runtime",
+    "StateSnapshot": "chainforgeledger.runtime",
+    "ExecutionResult": "chainforgeledger.runtime",
+
+    # Export cryptographic utilities
+    "sha256_hash": "chainforgeledger.crypto.hashing",
+    "keccak256_hash": "chainforgeledger.crypto.hashing",
+    "generate_keys": "chainforgeledger.crypto.keys",
+    "KeyPair": "chainforgeledger.crypto.keys",
+    "Signature": "chainforgeledger.crypto.signature",
+    "Wallet": "chainforgeledger.crypto.wallet",
+    "MultiSignature": "chainforgeledger.crypto.multisig",
+    "MultiSigWallet": "chainforgeledger.crypto.multisig",
+    "MnemonicGenerator": "chainforgeledger.crypto.mnemonic",
+
+    # Export networking
+    "Node": "chainforgeledger.networking.node",
+    "Peer": "chainforgeledger.networking.peer",
+    "Protocol": "chainforgeledger.networking.protocol",
+    "MemPool": "chainforgeledger.networking.mempool",
+    "RateLimiter": "chainforgeledger.networking.rate_limiter",
+
+    # Export smart contracts
+    "VirtualMachine": "chainforgeledger.smartcontracts.vm",
+    "Compiler": "chainforgeledger.smartcontracts.compiler",
+    "ContractExecutor": "chainforgeledger.smartcontracts.executor",
+    "ContractSandbox": "chainforgeledger.smartcontracts.sandbox",
+
+    # Export tokenomics
+    "Tokenomics": "chainforgeledger.tokenomics",
+    "KK20Token": "chainforgeledger.tokenomics.standards",
+    "KK721Token": "chainforgeledger.tokenomics.standards",
+    "TokenFactory": "chainforgeledger.tokenomics.standards",
+    "NativeCoin": "chainforgeledger.tokenomics.native",
+    "Stablecoin": "chainforgeledger.tokenomics.stablecoin",
+    "TreasuryManager": "chainforgeledger.tokenomics.treasury",
+
+    # Export governance
+    "Proposal": "chainforgeledger.governance.proposal",
+    "VotingSystem": "chainforgeledger.governance.voting",
+    "DAO": "chainforgeledger.governance.dao",
+
+    # Export storage
+    "Database": "chainforgeledger.storage.database",
+    "LevelDBStorage": "chainforgeledger.storage.leveldb",
+    "BlockStorage": "chainforgeledger.storage.models",
+    "TransactionStorage": "chainforgeledger.storage.models",
+
+    # Export API
+    "ApiServer": "chainforgeledger.api.server",
+    "ApiRoutes": "chainforgeledger.api.routes",
+
+    # Export utilities
+    "Config": "chainforgeledger.utils.config",
+    "CryptoUtils": "chainforgeledger.utils.crypto",
+    "get_logger": "chainforgeledger.utils.logger",
+    "configure_global_logger": "chainforgeledger.utils.logger",
+    "LoggerMixin": "chainforgeledger.utils.logger",
+}
+
+
+def __getattr__(name):
+    """Import an exported name from its submodule on first access."""
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """List module attributes including not yet imported exports."""
+    return sorted(set(globals()) | set(_LAZY))
 
 
 __all__ = [
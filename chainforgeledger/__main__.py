@@ -93,7 +93,7 @@ def run_basic_demo():
     # Mine a block
     print("\n3. Mining Block...")
     block = pow_consensus.mine_block(transactions, "miner1")
-    blockchain.add_block(block)
+    blockchain.add_block(block, trusted=True)
     print(f"   Block {block.index} mined")
     print(f"   Block Hash: {block.hash[:16]}...")
     print(f"   Transactions in Block: {len(block.transactions)}")
@@ -127,7 +127,7 @@ def run_comprehensive_demo():
     # Mine blocks
     for i in range(2):
         block = pow_consensus.mine_block(transactions, f"miner{i+1}")
-        blockchain.add_block(block)
+        blockchain.add_block(block, trusted=True)
         print(f"Block {block.index} mined: {block.hash[:16]}...")
     
     print(f"Blockchain length: {len(blockchain.chain)} blocks")
@@ -168,7 +168,7 @@ def run_pow_operations(args):
             transactions.append(tx.to_dict())
         
         block = pow_consensus.mine_block(transactions, f"miner{args.difficulty}")
-        blockchain.add_block(block)
+        blockchain.add_block(block, trusted=True)
         print(f"Block {block.index} mined")
         print(f"  Hash: {block.hash[:16]}...")
         print(f"  Nonce: {block.nonce}")
@@ -210,7 +210,7 @@ def run_pos_operations(args):
             transactions.append(tx.to_dict())
         
         block = pos_consensus.forge_block(transactions)
-        blockchain.add_block(block)
+        blockchain.add_block(block, trusted=True)
         print(f"Block {block.index} forged")
         print(f"  Hash: {block.hash[:16]}...")
         print(f"  Validator: {block.validator}")
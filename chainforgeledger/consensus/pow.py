@@ -4,12 +4,63 @@ ChainForgeLedger Proof of Work Consensus
 Proof of Work consensus mechanism implementation.
 """
 
+import hashlib
+import multiprocessing
 import time
+from typing import Optional
 from chainforgeledger.core.block import Block
 from chainforgeledger.core.blockchain import Blockchain
 from chainforgeledger.core.transaction import Transaction
 
 
+# Nonces each worker scans before results are collected
+NONCE_BATCH = 50000
+
+
+def _try_nonce_range(
+    prefix: bytes,
+    suffix: bytes,
+    start: int,
+    stride: int,
+    count: int,
+    target_zeros: int
+) -> Optional[int]:
+    """
+    Scan nonces start, start + stride, ... for a hash meeting the difficulty.
+    
+    Args:
+        prefix: Encoded block data preceding the nonce
+        suffix: Encoded block data following the nonce
+        start: First nonce to try
+        stride: Step between tried nonces
+        count: Number of nonces to try
+        target_zeros: Required number of leading zeros in the hex digest
+        
+    Returns:
+        First matching nonce, or None if the range has no match
+    """
+    # target_zeros leading hex zeros <=> digest below 2^(256 - 4 * target_zeros);
+    # equal-length bytes compare like big-endian integers, so the digest is
+    # checked against the encoded target without converting it to an int
+    target = (1 << (256 - 4 * target_zeros)).to_bytes(32, 'big') if target_zeros else None
+    
+    # The prefix never changes, so hash it once and clone the midstate
+    clone = hashlib.sha256(prefix).copy
+    
+    for nonce in range(start, start + stride * count, stride):
+        attempt = clone()
+        attempt.update(b'%d%s' % (nonce, suffix))
+        if target is None or attempt.digest() < target:
+            return nonce
+    
+    return None
+
+
+def _try_nonce_range_star(args: tuple) -> Optional[int]:
+    """Unpack pool arguments for _try_nonce_range."""
+    return _try_nonce_range(*args)
+
+
 class ProofOfWork:
     """
     Proof of Work consensus mechanism.
@@ -18,9 +69,16 @@ class ProofOfWork:
         blockchain: Blockchain instance
         difficulty: Mining difficulty
         reward: Block reward
+        workers: Number of processes searching nonces in parallel
     """
     
-    def __init__(self, blockchain: Blockchain, difficulty: int = 3, reward: float = 50.0):
+    def __init__(
+        self,
+        blockchain: Blockchain,
+        difficulty: int = 3,
+        reward: float = 50.0,
+        workers: Optional[int] = 1
+    ):
         """
         Initialize a new ProofOfWork instance.
         
@@ -28,10 +86,23 @@ class ProofOfWork:
             blockchain: Blockchain instance
             difficulty: Mining difficulty (number of leading zeros)
             reward: Block reward for miners
+            workers: Number of mining processes (None uses every CPU core)
         """
         self.blockchain = blockchain
         self.difficulty = difficulty
         self.reward = reward
+        self.workers = workers or multiprocessing.cpu_count()
+    
+    @property
+    def difficulty(self) -> int:
+        """Mining difficulty (number of leading zeros)."""
+        return self._difficulty
+    
+    @difficulty.setter
+    def difficulty(self, value: int):
+        self._difficulty = value
+        # Hex prefix every valid hash must start with, rebuilt only on change
+        self._difficulty_target = "0" * value
     
     def mine_block(self, transactions: list, miner_address: str) -> Block:
         """
@@ -64,22 +135,70 @@ class ProofOfWork:
             difficulty=self.difficulty
         )
         
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         
-        while True:
-            block_hash = self.calculate_hash_with_difficulty(block)
-            
-            if block_hash.startswith("0" * self.difficulty):
-                block.hash = block_hash
-                break
-                
-            block.nonce += 1
-            block.timestamp = time.time()
+        if self.workers > 1:
+            block.nonce = self._search_nonce_parallel(block)
+        else:
+            block.nonce = self._search_nonce(block)
+        block.hash = self.calculate_hash_with_difficulty(block)
         
-        mining_time = time.time() - start_time
+        mining_time = (time.perf_counter_ns() - start_time) / 1e9
         
         return block
     
+    def _search_nonce(self, block: Block) -> int:
+        """
+        Find a nonce satisfying the difficulty in the current process.
+        
+        Args:
+            block: Block being mined
+            
+        Returns:
+            Winning nonce
+        """
+        prefix, suffix = (part.encode('utf-8') for part in block.get_hash_parts())
+        start = block.nonce
+        
+        while True:
+            nonce = _try_nonce_range(prefix, suffix, start, 1, NONCE_BATCH, self.difficulty)
+            if nonce is not None:
+                return nonce
+            start += NONCE_BATCH
+    
+    def _search_nonce_parallel(self, block: Block) -> int:
+        """
+        Find a nonce satisfying the difficulty across a pool of processes.
+        
+        Worker i scans nonces base + i, base + i + workers, ... so the
+        workers cover disjoint interleaved ranges. Each round covers
+        workers * NONCE_BATCH nonces; the smallest match of the first
+        successful round wins.
+        
+        Args:
+            block: Block being mined
+            
+        Returns:
+            Winning nonce
+        """
+        prefix, suffix = (part.encode('utf-8') for part in block.get_hash_parts())
+        workers = self.workers
+        base = block.nonce
+        
+        with multiprocessing.Pool(workers) as pool:
+            while True:
+                tasks = [
+                    (prefix, suffix, base + offset, workers, NONCE_BATCH, self.difficulty)
+                    for offset in range(workers)
+                ]
+                found = [
+                    nonce for nonce in pool.map(_try_nonce_range_star, tasks)
+                    if nonce is not None
+                ]
+                if found:
+                    return min(found)
+                base += workers * NONCE_BATCH
+    
     def calculate_hash_with_difficulty(self, block: Block) -> str:
         """
         Calculate block hash with difficulty.
@@ -103,7 +222,7 @@ class ProofOfWork:
             True if valid
         """
         # Check hash starts with required number of zeros
-        if not block.hash.startswith("0" * self.difficulty):
+        if not block.hash.startswith(self._difficulty_target):
             return False
         
         # Validate block structure
@@ -28,6 +28,7 @@ class Validator:
             address: Validator's address
             stake: Initial staked amount
         """
+        self._manager = None
         self.address = address
         self.stake = stake
         self.reputation = 1.0
@@ -35,6 +36,43 @@ class Validator:
         self.status = "active"
         self.last_seen = 0
     
+    def _notify_manager(self):
+        """Tell the owning manager that selection weights changed."""
+        if self._manager is not None:
+            self._manager.invalidate_selection()
+    
+    @property
+    def stake(self) -> float:
+        """Staked amount."""
+        return self._stake
+    
+    @stake.setter
+    def stake(self, value: float):
+        delta = value - getattr(self, '_stake', 0.0)
+        self._stake = value
+        if self._manager is not None:
+            self._manager.adjust_stake(delta)
+    
+    @property
+    def reputation(self) -> float:
+        """Reputation score."""
+        return self._reputation
+    
+    @reputation.setter
+    def reputation(self, value: float):
+        self._reputation = value
+        self._notify_manager()
+    
+    @property
+    def status(self) -> str:
+        """Validator status."""
+        return self._status
+    
+    @status.setter
+    def status(self, value: str):
+        self._status = value
+        self._notify_manager()
+    
     def update_stake(self, amount: float):
         """
         Update staked amount.
@@ -150,6 +188,24 @@ class ValidatorManager:
     def __init__(self):
         """Initialize validator manager with empty pool."""
         self.validators = {}
+        self._alias_table = None
+        self._active_validators = None
+        self._total_stake = 0.0
+    
+    def invalidate_selection(self):
+        """Discard cached selection data so it is rebuilt on next use."""
+        self._alias_table = None
+        self._active_validators = None
+    
+    def adjust_stake(self, delta: float):
+        """
+        Apply a validator's stake change to the running total.
+        
+        Args:
+            delta: Change in stake (can be negative)
+        """
+        self._total_stake += delta
+        self.invalidate_selection()
     
     def add_validator(self, validator: Validator):
         """
@@ -158,7 +214,16 @@ class ValidatorManager:
         Args:
             validator: Validator to add
         """
+        replaced = self.validators.get(validator.address)
+        if replaced is not None and replaced is not validator:
+            replaced._manager = None
+            self._total_stake -= replaced.stake
+        
+        if replaced is not validator:
+            self._total_stake += validator.stake
         self.validators[validator.address] = validator
+        validator._manager = self
+        self.invalidate_selection()
     
     def remove_validator(self, address: str) -> bool:
         """
@@ -171,7 +236,10 @@ class ValidatorManager:
             True if successful
         """
         if address in self.validators:
-            del self.validators[address]
+            validator = self.validators.pop(address)
+            validator._manager = None
+            self._total_stake -= validator.stake
+            self.invalidate_selection()
             return True
         return False
     
@@ -203,7 +271,9 @@ class ValidatorManager:
         Returns:
             List of active validators
         """
-        return [v for v in self.validators.values() if v.is_active()]
+        if self._active_validators is None:
+            self._active_validators = [v for v in self.validators.values() if v.is_active()]
+        return list(self._active_validators)
     
     def get_total_stake(self) -> float:
         """
@@ -212,31 +282,65 @@ class ValidatorManager:
         Returns:
             Total staked amount
         """
-        return sum(v.stake for v in self.validators.values())
+        return self._total_stake
+    
+    def _build_alias_table(self) -> tuple:
+        """
+        Build Walker's alias table over active validators' effective stake.
+        
+        Returns:
+            Tuple of (validators, probabilities, aliases)
+        """
+        active_validators = self.get_active_validators()
+        count = len(active_validators)
+        weights = [v.get_effective_stake() for v in active_validators]
+        total_effective_stake = sum(weights)
+        
+        if total_effective_stake <= 0:
+            # No stake to weight by, fall back to the first active validator
+            return active_validators, [1.0] + [0.0] * (count - 1), [0] * count
+        
+        scaled = [w * count / total_effective_stake for w in weights]
+        probabilities = [1.0] * count
+        aliases = list(range(count))
+        small = [i for i, w in enumerate(scaled) if w < 1.0]
+        large = [i for i, w in enumerate(scaled) if w >= 1.0]
+        
+        while small and large:
+            low = small.pop()
+            high = large[-1]
+            probabilities[low] = scaled[low]
+            aliases[low] = high
+            scaled[high] -= 1.0 - scaled[low]
+            if scaled[high] < 1.0:
+                small.append(large.pop())
+        
+        return active_validators, probabilities, aliases
     
     def select_validator(self) -> Optional[Validator]:
         """
         Select validator based on stake and reputation.
         
+        Uses an alias table that is rebuilt only after validators are added,
+        removed or change stake, reputation or status, so each pick is O(1).
+        
         Returns:
             Selected validator
         """
-        active_validators = self.get_active_validators()
+        if self._alias_table is None:
+            self._alias_table = self._build_alias_table()
+        
+        active_validators, probabilities, aliases = self._alias_table
         
         if not active_validators:
             return None
         
         # Weight by effective stake
-        total_effective_stake = sum(v.get_effective_stake() for v in active_validators)
-        random_value = random.uniform(0, total_effective_stake)
-        current = 0.0
-        
-        for validator in active_validators:
-            current += validator.get_effective_stake()
-            if random_value <= current:
-                return validator
+        index = random.randrange(len(active_validators))
+        if random.random() >= probabilities[index]:
+            index = aliases[index]
         
-        return active_validators[0]
+        return active_validators[index]
     
     def update_validator_status(self, address: str, active: bool):
         """
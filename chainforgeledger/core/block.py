@@ -4,9 +4,10 @@ ChainForgeLedger Block Module
 Represents a single block in the blockchain.
 """
 
+import hashlib
 import time
-from typing import List
-from chainforgeledger.crypto.hashing import sha256_hash
+from typing import List, Tuple
+from chainforgeledger.core.merkle import compute_root
 
 
 class Block:
@@ -55,6 +56,19 @@ class Block:
         self.difficulty = difficulty
         self.hash = self.calculate_hash()
     
+    def get_hash_parts(self) -> Tuple[str, str]:
+        """
+        Split the hashed block data around the nonce.
+        
+        Returns:
+            Tuple of (prefix, suffix) such that the block hash is
+            sha256(prefix + str(nonce) + suffix)
+        """
+        prefix = f"{self.index}{self.previous_hash}{self.transactions!s}{self.timestamp}"
+        suffix = f"{self.validator or ''}{self.difficulty}"
+        
+        return prefix, suffix
+    
     def calculate_hash(self) -> str:
         """
         Calculate block hash using SHA-256.
@@ -62,17 +76,23 @@ class Block:
         Returns:
             SHA-256 hash of the block
         """
-        data = (
-            str(self.index) +
-            str(self.previous_hash) +
-            str(self.transactions) +
-            str(self.timestamp) +
-            str(self.nonce) +
-            str(self.validator or "") +
-            str(self.difficulty)
-        )
+        prefix, suffix = self.get_hash_parts()
+        
+        return hashlib.sha256(f"{prefix}{self.nonce}{suffix}".encode('utf-8')).hexdigest()
+    
+    def compute_tx_root(self) -> str:
+        """
+        Compute the Merkle root of the block's transactions.
         
-        return sha256_hash(data)
+        Returns:
+            Hex-encoded root over the SHA-256 digests of the transactions,
+            or the hash of empty input for a block without transactions
+        """
+        sha256 = hashlib.sha256
+        leaves = b''.join([sha256(str(tx).encode('utf-8')).digest() for tx in self.transactions])
+        if not leaves:
+            return sha256(b'').hexdigest()
+        return compute_root(leaves).hex()
     
     def validate_block(self) -> bool:
         """
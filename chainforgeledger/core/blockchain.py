@@ -4,10 +4,36 @@ ChainForgeLedger Blockchain Module
 Core blockchain data structure and management.
 """
 
-from typing import Optional
+import threading
+from typing import List, Optional
 from chainforgeledger.core.block import Block
+from chainforgeledger.runtime.executor import get_pool, get_pool_size
 
 
+PARALLEL_MIN_BLOCKS = 64  # Smaller ranges are validated on the calling thread
+
+
+def _validate_shard(chain: List[Block], start: int, end: int, failed: threading.Event) -> bool:
+    """
+    Recompute and check the hashes of chain[start:end].
+    
+    Args:
+        chain: Blocks being validated
+        start: First index of the shard
+        end: Index one past the last block of the shard
+        failed: Event set by any shard that finds an invalid block
+        
+    Returns:
+        True if every block in the shard carries its own hash
+    """
+    for i in range(start, end):
+        if failed.is_set():
+            return False
+        if not chain[i].validate_block():
+            failed.set()
+            return False
+    return True
+
 
 class Blockchain:
     """
@@ -29,6 +55,9 @@ class Blockchain:
         """
         self.chain = []
         self._block_hash_map = {}  # For O(1) block lookups by hash
+        self._last_valid_index = 0  # Highest block index known to be valid
+        self._last_valid_block = None
+        self._validated_chain = None
         self.difficulty = difficulty
         self.reward = reward
         self.create_genesis_block()
@@ -55,25 +84,34 @@ class Blockchain:
         """
         return self.chain[-1]
     
-    def add_block(self, block: Block):
+    def add_block(self, block: Block, trusted: bool = False):
         """
         Add a new block to the chain.
         
         Args:
             block: Block to add
+            trusted: Block was produced locally, skip recomputing its hash
         """
-        if self.is_valid_block(block):
+        if self.is_valid_block(block, trusted=trusted):
+            extends_valid_prefix = self._validated_up_to() == len(self.chain) - 1
             self.chain.append(block)
             self._block_hash_map[block.hash] = block
+            if extends_valid_prefix:
+                self._mark_valid(len(self.chain) - 1)
         else:
             raise ValueError("Invalid block")
     
-    def is_valid_block(self, block: Block) -> bool:
+    def is_valid_block(self, block: Block, trusted: bool = False,
+                       verify_transactions: bool = False) -> bool:
         """
         Validate a block before adding to the chain.
         
         Args:
             block: Block to validate
+            trusted: Block was produced locally, so only its linkage to the
+                chain is checked and its hash is not recomputed
+            verify_transactions: Also check the signature of every
+                Transaction object in the block
             
         Returns:
             True if block is valid
@@ -89,19 +127,107 @@ class Blockchain:
             return False
         
         # Check block hash
-        if not block.validate_block():
+        if not trusted and not block.validate_block():
+            return False
+        
+        # Check transaction signatures
+        if verify_transactions and not self._verify_transactions(block.transactions):
             return False
         
         return True
     
-    def is_chain_valid(self) -> bool:
+    def _verify_transactions(self, transactions: list) -> bool:
+        """
+        Verify transaction signatures, stopping at the first invalid one.
+        
+        Checks run serially: is_valid_signature is only a presence check,
+        so dispatching it to worker threads would cost more than it saves.
+        
+        Args:
+            transactions: Transactions of the block being validated
+            
+        Returns:
+            True if every signature is valid
+        """
+        return all(
+            tx.is_valid_signature() for tx in transactions
+            if hasattr(tx, 'is_valid_signature')
+        )
+    
+    def replace_chain(self, chain: List[Block]):
+        """
+        Replace the whole chain, e.g. after a fork reorganization.
+        
+        The hash index is rebuilt so blocks dropped from the chain can no
+        longer be found by hash, and validation restarts at genesis.
+        
+        Args:
+            chain: New list of blocks, starting at genesis
+        """
+        self.chain = chain
+        self._block_hash_map = {block.hash: block for block in chain}
+        self.invalidate_validation()
+    
+    def invalidate_validation(self):
+        """Forget validation progress so the next check starts at genesis."""
+        self._last_valid_index = 0
+        self._last_valid_block = None
+        self._validated_chain = None
+    
+    def _mark_valid(self, index: int):
+        """Record that blocks up to index have been validated."""
+        self._last_valid_index = index
+        self._last_valid_block = self.chain[index]
+        self._validated_chain = self.chain
+    
+    def _validated_up_to(self) -> int:
+        """
+        Get the highest index whose prefix is still known to be valid.
+        
+        The marker is discarded if the chain list was replaced, truncated,
+        or the block at the marker was swapped out or rehashed.
+        
+        Returns:
+            Index of the last validated block
+        """
+        index = self._last_valid_index
+        block = self._last_valid_block
+        
+        if (
+            block is None
+            or self._validated_chain is not self.chain
+            or index >= len(self.chain)
+            or self.chain[index] is not block
+            or block.hash != block.calculate_hash()
+        ):
+            self.invalidate_validation()
+            return 0
+        
+        return index
+    
+    def is_chain_valid(self, workers: Optional[int] = 1) -> bool:
         """
-        Validate the entire blockchain.
+        Validate the blockchain.
         
+        Only blocks appended since the last successful check are verified;
+        call invalidate_validation() after editing blocks already in the
+        chain to force a full re-check.
+        
+        Args:
+            workers: Shards the block hashes are recomputed in, on the shared
+                verification pool, when at least PARALLEL_MIN_BLOCKS blocks
+                need checking (None uses one shard per pool thread)
+            
         Returns:
             True if chain is valid
         """
-        for i in range(1, len(self.chain)):
+        start = self._validated_up_to() + 1
+        workers = workers or get_pool_size()
+        
+        if workers > 1 and len(self.chain) - start >= PARALLEL_MIN_BLOCKS:
+            return self._is_range_valid_parallel(start, workers)
+        
+        for i in range(start, len(self.chain)):
             current_block = self.chain[i]
             previous_block = self.chain[i-1]
             
@@ -116,7 +242,50 @@ class Blockchain:
             # Check block hash
             if not current_block.validate_block():
                 return False
+            
+            self._mark_valid(i)
+        
+        return True
+    
+    def _is_range_valid_parallel(self, start: int, workers: int) -> bool:
+        """
+        Validate chain[start:] with block hashes recomputed on the shared pool.
+        
+        Links are checked in a single sequential pass first, since they only
+        compare stored fields; the hash checks are then split into contiguous
+        shards and stop early once any shard finds a bad block.
+        
+        Args:
+            start: First index to validate
+            workers: Number of shards and threads
+            
+        Returns:
+            True if every block from start onwards is valid
+        """
+        chain = self.chain
+        end = len(chain)
+        
+        for i in range(start, end):
+            current_block = chain[i]
+            previous_block = chain[i-1]
+            if current_block.index != previous_block.index + 1:
+                return False
+            if current_block.previous_hash != previous_block.hash:
+                return False
+        
+        shard_size = -(-(end - start) // workers)
+        failed = threading.Event()
+        pool = get_pool()
+        futures = [
+            pool.submit(_validate_shard, chain, lo, min(lo + shard_size, end), failed)
+            for lo in range(start, end, shard_size)
+        ]
+        results = [future.result() for future in futures]
+        
+        if not all(results):
+            return False
         
+        self._mark_valid(end - 1)
         return True
     
     def get_block_by_index(self, index: int) -> Optional[Block]:
@@ -11,7 +11,7 @@ A comprehensive execution pipeline that handles:
 """
 
 import time
-from typing import Dict, List, Any
+from typing import Callable, Dict, List, Any
 from dataclasses import dataclass, field
 from chainforgeledger.core.receipt import TransactionReceipt, create_transaction_receipt
 
@@ -38,8 +38,17 @@ class ExecutionPipeline:
         self.gas_calculator = options.get('gasCalculator')
         self.fee_calculator = options.get('feeCalculator')
         self.event_emitter = options.get('eventEmitter')
-        self.plugins = options.get('plugins', [])
+        self.plugins = list(options.get('plugins', []))
         self.logger = options.get('logger')
+        self._hook_cache: Dict[str, List[Callable]] = {}  # Hook name -> bound plugin methods
+    
+    def _hooks(self, name: str) -> List[Callable]:
+        """Get the plugin methods implementing a hook, resolved once per plugin set"""
+        hooks = self._hook_cache.get(name)
+        if hooks is None:
+            hooks = [getattr(plugin, name) for plugin in self.plugins if hasattr(plugin, name)]
+            self._hook_cache[name] = hooks
+        return hooks
     
     async def process_transaction(self, transaction: Any, context: PipelineContext = None) -> 'TransactionReceipt':
         """Process a single transaction"""
@@ -64,9 +73,8 @@ class ExecutionPipeline:
                 return receipt
             
             # Execute pre-processing plugins
-            for plugin in self.plugins:
-                if hasattr(plugin, 'pre_process_transaction'):
-                    await plugin.pre_process_transaction(transaction, context)
+            for hook in self._hooks('pre_process_transaction'):
+                await hook(transaction, context)
             
             # Estimate gas requirements
             estimated_gas = self.gas_calculator.estimate_gas(transaction)
@@ -106,9 +114,8 @@ class ExecutionPipeline:
                 })
             
             # Execute post-processing plugins
-            for plugin in self.plugins:
-                if hasattr(plugin, 'post_process_transaction'):
-                    await plugin.post_process_transaction(transaction, context, receipt)
+            for hook in self._hooks('post_process_transaction'):
+                await hook(transaction, context, receipt)
             
             # Emit events
             if self.event_emitter:
@@ -140,9 +147,8 @@ class ExecutionPipeline:
         cumulative_gas_used = 0
         
         # Execute block-level pre-processing plugins
-        for plugin in self.plugins:
-            if hasattr(plugin, 'pre_process_block'):
-                await plugin.pre_process_block(block, context)
+        for hook in self._hooks('pre_process_block'):
+            await hook(block, context)
         
         for transaction in block.transactions:
             # Check gas limit
@@ -161,9 +167,8 @@ class ExecutionPipeline:
             receipts.append(receipt)
         
         # Execute block-level post-processing plugins
-        for plugin in self.plugins:
-            if hasattr(plugin, 'post_process_block'):
-                await plugin.post_process_block(block, context, receipts)
+        for hook in self._hooks('post_process_block'):
+            await hook(block, context, receipts)
         
         return receipts
     
@@ -213,10 +218,9 @@ class ExecutionPipeline:
                 errors.append(f"Invalid transaction: {validation['message']}")
         
         # Execute validation plugins
-        for plugin in self.plugins:
-            if hasattr(plugin, 'validate_block'):
-                plugin_errors = await plugin.validate_block(block)
-                errors.extend(plugin_errors)
+        for hook in self._hooks('validate_block'):
+            plugin_errors = await hook(block)
+            errors.extend(plugin_errors)
         
         return {
             'isValid': len(errors) == 0,
@@ -226,11 +230,13 @@ class ExecutionPipeline:
     def add_plugin(self, plugin: Any):
         """Add plugin to pipeline"""
         self.plugins.append(plugin)
+        self._hook_cache.clear()
     
     def remove_plugin(self, plugin: Any):
         """Remove plugin from pipeline"""
         if plugin in self.plugins:
             self.plugins.remove(plugin)
+            self._hook_cache.clear()
     
     def get_plugins(self) -> List[Any]:
         """Get all plugins"""
@@ -119,8 +119,7 @@ class ForkHandler:
         if len(peer_chain) > len(self.blockchain.chain):
             # Verify peer chain is valid before switching
             if self._is_chain_valid(peer_chain):
-                self.blockchain.chain = peer_chain
-                self._update_block_hash_map()
+                self.blockchain.replace_chain(peer_chain)
                 return True
                 
         return False
@@ -140,8 +139,7 @@ class ForkHandler:
         
         if peer_difficulty > local_difficulty:
             if self._is_chain_valid(peer_chain):
-                self.blockchain.chain = peer_chain
-                self._update_block_hash_map()
+                self.blockchain.replace_chain(peer_chain)
                 return True
                 
         return False
@@ -161,8 +159,7 @@ class ForkHandler:
         
         if peer_timestamp > local_timestamp:
             if self._is_chain_valid(peer_chain):
-                self.blockchain.chain = peer_chain
-                self._update_block_hash_map()
+                self.blockchain.replace_chain(peer_chain)
                 return True
                 
         return False
@@ -192,14 +189,6 @@ class ForkHandler:
                 
         return True
     
-    def _update_block_hash_map(self):
-        """
-        Update the block hash map after chain changes.
-        """
-        self.blockchain._block_hash_map = {}
-        for block in self.blockchain.chain:
-            self.blockchain._block_hash_map[block.hash] = block
-    
     def get_fork_info(self) -> List[dict]:
         """
         Get information about detected forks.
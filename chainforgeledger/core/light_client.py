@@ -6,6 +6,7 @@ without executing full block states, providing a lightweight way to interact
 with the blockchain network.
 """
 
+import hashlib
 import time
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, field
@@ -36,6 +37,8 @@ class LightClient:
         self.genesis_block = options.get('genesisBlock')
         self.block_headers: Dict[int, BlockHeader] = {}
         self.current_block_height = 0
+        self._levels: List[bytearray] = []  # Packed 32-byte digests per tree level
+        self._proof_cache: Dict[int, List[bytes]] = {}
         
         if self.genesis_block:
             self.block_headers[0] = self.genesis_block
@@ -127,6 +130,81 @@ class LightClient:
         
         return current_hash == root
     
+    def add_leaf(self, leaf_hash: bytes) -> int:
+        """
+        Append a 32-byte leaf digest to the tracked Merkle tree
+        Only the nodes on the new leaf's path to the root are rehashed;
+        returns the leaf index
+        """
+        if len(leaf_hash) != 32:
+            raise ValueError("Leaf hash must be 32 bytes")
+        
+        if not self._levels:
+            self._levels.append(bytearray())
+        self._levels[0] += leaf_hash
+        index = len(self._levels[0]) // 32 - 1
+        leaf_index = index
+        
+        level = 0
+        while len(self._levels[level]) > 32:
+            nodes = self._levels[level]
+            left = (index & ~1) * 32
+            pair = bytes(nodes[left:left + 64])
+            if len(pair) == 32:
+                pair += pair
+            if level + 1 == len(self._levels):
+                self._levels.append(bytearray())
+            index >>= 1
+            self._levels[level + 1][index * 32:(index + 1) * 32] = hashlib.sha256(pair).digest()
+            level += 1
+        
+        self._proof_cache.clear()
+        return leaf_index
+    
+    def get_merkle_root(self) -> Optional[bytes]:
+        """Get the root digest of the tracked Merkle tree"""
+        if not self._levels:
+            return None
+        return bytes(self._levels[-1])
+    
+    def generate_proof(self, index: int) -> List[bytes]:
+        """
+        Get the sibling digests from a tracked leaf up to the root
+        Paths are cached until the next leaf is added
+        """
+        if index in self._proof_cache:
+            return list(self._proof_cache[index])
+        
+        if not self._levels or not 0 <= index < len(self._levels[0]) // 32:
+            raise ValueError(f"Leaf index out of range: {index}")
+        
+        path = []
+        position = index
+        for nodes in self._levels[:-1]:
+            sibling = position ^ 1
+            node = nodes[sibling * 32:(sibling + 1) * 32] or nodes[position * 32:(position + 1) * 32]
+            path.append(bytes(node))
+            position >>= 1
+        
+        self._proof_cache[index] = path
+        return list(path)
+    
+    @staticmethod
+    def verify_proof(leaf_hash: bytes, index: int, path: List[bytes], root: bytes) -> bool:
+        """
+        Verify a binary Merkle path for the leaf at index
+        The low bit of the index at each level says whether the sibling is on the left
+        """
+        sha256 = hashlib.sha256
+        current = leaf_hash
+        for sibling in path:
+            if index & 1:
+                current = sha256(sibling + current).digest()
+            else:
+                current = sha256(current + sibling).digest()
+            index >>= 1
+        return current == root
+    
     def verify_transaction_inclusion(self, transaction_hash: str, block_header: BlockHeader, proof: List[str]) -> bool:
         """Verify that a transaction exists in a block"""
         return self.verify_merkle_proof(block_header.tx_root, transaction_hash, proof)
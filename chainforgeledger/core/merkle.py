@@ -4,8 +4,180 @@ ChainForgeLedger Merkle Tree Module
 Merkle tree implementation for blockchain transaction verification.
 """
 
-from typing import List
-from chainforgeledger.crypto.hashing import sha256_hash
+import hashlib
+# concurrent.futures loads its process pool module on first attribute access,
+# so the multiprocessing machinery is only imported when a tree hashes in parallel
+import concurrent.futures
+import threading
+from typing import Dict, List, Optional
+
+
+def _hash_text(text: str) -> str:
+    """
+    Hash a single string with hashlib, matching crypto.hashing.sha256_hash.
+    
+    Args:
+        text: Text to hash
+        
+    Returns:
+        Hex-encoded SHA-256 digest
+    """
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def _hash_leaves(transactions: List) -> List[str]:
+    """
+    Hash every transaction into a leaf in a single pass.
+    
+    Args:
+        transactions: Transactions to hash
+        
+    Returns:
+        Leaf hashes in transaction order
+    """
+    sha256 = hashlib.sha256
+    return [sha256(str(tx).encode('utf-8')).hexdigest() for tx in transactions]
+
+
+def _hash_level(level: List[str]) -> List[str]:
+    """
+    Hash all sibling pairs of a tree level into the next level.
+    
+    Pairs are taken straight off one iterator with zip, duplicating the last
+    hash when the level has an odd length. Results match
+    crypto.hashing.sha256_hash(left + right).
+    
+    Args:
+        level: Hex-encoded hashes of one tree level
+        
+    Returns:
+        Hex-encoded hashes of the parent level
+    """
+    if len(level) % 2:
+        level = level + [level[-1]]
+    
+    sha256 = hashlib.sha256
+    siblings = iter(level)
+    return [sha256((left + right).encode('ascii')).hexdigest() for left, right in zip(siblings, siblings)]
+
+
+def _hash_pairs(level: bytes) -> bytes:
+    """
+    Hash consecutive 64-byte sibling pairs of a packed digest buffer.
+    
+    Args:
+        level: Concatenated 32-byte digests, an even number of them
+        
+    Returns:
+        Concatenated 32-byte parent digests
+    """
+    sha256 = hashlib.sha256
+    view = memoryview(level)
+    return b''.join([sha256(view[i:i + 64]).digest() for i in range(0, len(level), 64)])
+
+
+# Worker processes for parallel level hashing, one pool per requested size,
+# created on first use and reused by every later tree. Pools are never
+# replaced, so a pool a caller is mapping over is never shut down under it.
+_PROCESS_POOLS: "Dict[int, concurrent.futures.ProcessPoolExecutor]" = {}
+_PROCESS_POOLS_LOCK = threading.Lock()
+
+
+def _get_process_pool(workers: int) -> "concurrent.futures.ProcessPoolExecutor":
+    """
+    Get the shared process pool with the given number of workers.
+    
+    Level hashing runs in processes rather than on the verification thread
+    pool in runtime.executor: every sibling pair is a 64-byte hash, and
+    hashlib only releases the GIL for much larger inputs, so threads would
+    take turns on the GIL instead of hashing in parallel.
+    
+    Args:
+        workers: Number of worker processes
+        
+    Returns:
+        Process pool, created on first use
+    """
+    pool = _PROCESS_POOLS.get(workers)
+    if pool is not None:
+        return pool
+    
+    with _PROCESS_POOLS_LOCK:
+        # Another thread may have created the pool while this one waited
+        pool = _PROCESS_POOLS.get(workers)
+        if pool is None:
+            pool = concurrent.futures.ProcessPoolExecutor(max_workers=workers)
+            _PROCESS_POOLS[workers] = pool
+        return pool
+
+
+# Packed levels with fewer digests are hashed serially by compute_root
+PARALLEL_MIN_NODES = 256
+
+
+def compute_root(leaf_hashes: bytes, max_workers: Optional[int] = None) -> bytes:
+    """
+    Compute a Merkle root over packed binary leaf digests.
+    
+    Each level is kept as one contiguous buffer of 32-byte digests, and
+    sibling pairs are hashed straight from 64-byte slices of it, without
+    building per-node strings. An odd last digest is paired with itself.
+    
+    Args:
+        leaf_hashes: Concatenated 32-byte SHA-256 leaf digests
+        max_workers: Worker processes used for levels with at least
+            PARALLEL_MIN_NODES digests (None hashes serially); the pool is
+            shared with later calls
+        
+    Returns:
+        32-byte Merkle root digest
+    """
+    if not leaf_hashes or len(leaf_hashes) % 32:
+        raise ValueError("Leaf hashes must be a non-empty multiple of 32 bytes")
+    
+    level = bytes(leaf_hashes)
+    executor = None
+    if max_workers and max_workers > 1 and len(level) >= 32 * PARALLEL_MIN_NODES:
+        executor = _get_process_pool(max_workers)
+    
+    while len(level) > 32:
+        if len(level) % 64:
+            level += level[-32:]
+        if executor is not None and len(level) >= 32 * PARALLEL_MIN_NODES:
+            chunk = 64 * -(-len(level) // (64 * max_workers))
+            chunks = [level[i:i + chunk] for i in range(0, len(level), chunk)]
+            level = b''.join(executor.map(_hash_pairs, chunks))
+        else:
+            level = _hash_pairs(level)
+    
+    return level
+
+
+# Levels with fewer sibling pairs are hashed serially; below this size the
+# cost of shipping work to a process pool outweighs the hashing itself
+PARALLEL_MIN_PAIRS = 64
+
+
+def _hash_level_parallel(level: List[str], executor: concurrent.futures.Executor, workers: int) -> List[str]:
+    """
+    Hash a tree level by splitting its sibling pairs across a process pool.
+    
+    Args:
+        level: Hex-encoded hashes of one tree level
+        executor: Pool the pair chunks are dispatched to
+        workers: Number of worker processes in the pool
+        
+    Returns:
+        Hex-encoded hashes of the parent level
+    """
+    pairs = (len(level) + 1) // 2
+    chunk = 2 * max(1, pairs // (4 * workers))
+    chunks = [level[i:i + chunk] for i in range(0, len(level), chunk)]
+    
+    next_level = []
+    for hashes in executor.map(_hash_level, chunks):
+        next_level.extend(hashes)
+    return next_level
 
 
 class MerkleTree:
@@ -16,46 +188,51 @@ class MerkleTree:
         transactions: List of transactions
         root: Root hash of the merkle tree
         levels: Tree levels
+        max_workers: Worker processes used to hash large levels (None hashes serially)
     """
     
-    def __init__(self, transactions: List[str]):
+    def __init__(self, transactions: List[str], max_workers: Optional[int] = None):
         """
         Initialize a new MerkleTree instance.
         
         Args:
             transactions: List of transactions
+            max_workers: Worker processes used to hash levels with at least
+                PARALLEL_MIN_PAIRS sibling pairs (None hashes serially)
         """
         self.transactions = transactions
+        self.max_workers = max_workers
         self.root = None
         self.levels = []
+        self._index = {}
         self.build_tree()
     
     def build_tree(self):
         """Build the Merkle tree from transactions."""
+        self.levels = []
+        
+        # Map each transaction's string form to its first position
+        self._index = {}
+        for i, tx in enumerate(self.transactions):
+            self._index.setdefault(str(tx), i)
+        
         if not self.transactions:
-            self.root = sha256_hash("")
+            self.root = _hash_text("")
             return
         
         # Initialize leaves
-        leaves = [sha256_hash(str(tx)) for tx in self.transactions]
+        leaves = _hash_leaves(self.transactions)
         self.levels.append(leaves)
         
-        # Build tree
+        # Build tree, one batch of sibling pairs per level
+        if self.max_workers and self.max_workers > 1 and len(leaves) >= 2 * PARALLEL_MIN_PAIRS:
+            executor = _get_process_pool(self.max_workers)
+            while len(leaves) >= 2 * PARALLEL_MIN_PAIRS:
+                leaves = _hash_level_parallel(leaves, executor, self.max_workers)
+                self.levels.append(leaves)
+        
         while len(leaves) > 1:
-            next_level = []
-            
-            # Process pairs
-            for i in range(0, len(leaves), 2):
-                left_hash = leaves[i]
-                
-                # If odd number of leaves, duplicate the last one
-                right_hash = leaves[i + 1] if (i + 1) < len(leaves) else left_hash
-                
-                # Combine and hash
-                combined_hash = sha256_hash(left_hash + right_hash)
-                next_level.append(combined_hash)
-            
-            leaves = next_level
+            leaves = _hash_level(leaves)
             self.levels.append(leaves)
         
         self.root = self.levels[-1][0]
@@ -69,35 +246,103 @@ class MerkleTree:
         """
         return self.root
     
-    def get_proof(self, transaction: str) -> List[str]:
+    def contains(self, transaction) -> bool:
+        """
+        Check whether a transaction is part of the tree.
+        
+        Args:
+            transaction: Transaction to look up
+            
+        Returns:
+            True if the transaction is in the tree
+        """
+        return str(transaction) in self._index
+    
+    def get_index(self, transaction) -> int:
+        """
+        Get the leaf position of a transaction.
+        
+        Args:
+            transaction: Transaction to look up
+            
+        Returns:
+            Index of the first matching transaction, or -1 if absent
+        """
+        return self._index.get(str(transaction), -1)
+    
+    def get_proof(self, transaction: str, cache_depth: int = 0) -> List[str]:
         """
         Get merkle proof for a specific transaction.
         
         Args:
             transaction: Transaction to get proof for
+            cache_depth: Number of top levels the verifier holds in its
+                cache; the proof stops at that layer instead of the root
             
         Returns:
             List of hashes forming the merkle proof
         """
-        if transaction not in self.transactions:
+        index = self.get_index(transaction)
+        if index == -1:
             return []
             
-        index = self.transactions.index(transaction)
         proof = []
         
-        # Traverse levels
-        for level in self.levels:
-            if len(level) == 1:
-                break
-                
+        # Traverse levels up to the cached layer
+        for level in self.levels[:max(1, len(self.levels) - cache_depth) - 1]:
             sibling_index = index + 1 if index % 2 == 0 else index - 1
-            sibling_hash = level[sibling_index]
+            
+            # The last node of an odd level is paired with itself
+            sibling_hash = level[sibling_index] if sibling_index < len(level) else level[index]
             proof.append(sibling_hash)
             
             index = index // 2
         
         return proof
     
+    def get_cached_layer(self, cache_depth: int) -> List[str]:
+        """
+        Get the tree layer cache_depth levels below the root.
+        
+        Args:
+            cache_depth: Depth of the layer (0 is the root layer)
+            
+        Returns:
+            Hashes of that layer
+        """
+        height = len(self.levels) - 1
+        return self.levels[max(0, height - cache_depth)]
+    
+    def verify_tx(self, index: int, transaction: str, proof: List[str]) -> bool:
+        """
+        Verify a transaction against the cached tree layers.
+        
+        The proof only has to reach the layer it was truncated at (see
+        get_proof's cache_depth); the reconstructed node is compared with the
+        stored node at that layer, so the levels above it are never rehashed.
+        
+        Args:
+            index: Leaf position of the transaction
+            transaction: Transaction to verify
+            proof: Merkle proof from get_proof
+            
+        Returns:
+            True if the transaction is included at index
+        """
+        if not self.levels or not 0 <= index < len(self.levels[0]) or len(proof) >= len(self.levels):
+            return False
+        
+        current_hash = _hash_text(str(transaction))
+        
+        for sibling_hash in proof:
+            if index % 2 == 0:
+                current_hash = _hash_text(current_hash + sibling_hash)
+            else:
+                current_hash = _hash_text(sibling_hash + current_hash)
+            index = index // 2
+        
+        return self.levels[len(proof)][index] == current_hash
+    
     def verify_proof(self, transaction: str, proof: List[str], root: str) -> bool:
         """
         Verify a merkle proof for a transaction.
@@ -113,11 +358,11 @@ class MerkleTree:
         if not transaction or not proof:
             return False
             
-        current_hash = sha256_hash(str(transaction))
+        current_hash = _hash_text(str(transaction))
         
         for sibling_hash in proof:
             # Determine if current hash should be left or right
-            current_hash = sha256_hash(current_hash + sibling_hash)
+            current_hash = _hash_text(current_hash + sibling_hash)
         
         return current_hash == root
     
@@ -142,7 +387,32 @@ class MerkleTree:
             transaction: Transaction to add
         """
         self.transactions.append(transaction)
-        self.build_tree()
+        self._index.setdefault(str(transaction), len(self.transactions) - 1)
+        
+        if not self.levels:
+            self.build_tree()
+            return
+        
+        # Only the path from the new leaf to the root changes
+        self.levels[0].append(_hash_text(str(transaction)))
+        height = 0
+        while len(self.levels[height]) > 1:
+            level = self.levels[height]
+            parent_index = (len(level) - 1) // 2
+            left_hash = level[2 * parent_index]
+            right_hash = level[2 * parent_index + 1] if 2 * parent_index + 1 < len(level) else left_hash
+            parent_hash = _hash_text(left_hash + right_hash)
+            
+            if height + 1 == len(self.levels):
+                self.levels.append([])
+            parents = self.levels[height + 1]
+            if parent_index < len(parents):
+                parents[parent_index] = parent_hash
+            else:
+                parents.append(parent_hash)
+            height += 1
+        
+        self.root = self.levels[-1][0]
     
     def remove_transaction(self, transaction: str):
         """
@@ -106,7 +106,7 @@ class ShardManager:
         # Move blocks to new shard
         split_point = len(blockchain.chain) // 2
         new_blocks = blockchain.chain[split_point:]
-        blockchain.chain = blockchain.chain[:split_point]
+        blockchain.replace_chain(blockchain.chain[:split_point])
         
         for block in new_blocks:
             self.shards[new_shard_id].add_block(block)
@@ -4,8 +4,8 @@ ChainForgeLedger Transaction Module
 Transaction management and validation.
 """
 
+import hashlib
 import time
-from chainforgeledger.crypto.hashing import sha256_hash
 
 class Transaction:
     """
@@ -21,6 +21,12 @@ class Transaction:
         data: Additional transaction data
     """
     
+    # Fixed attribute layout: no per-instance __dict__ for pooled transactions
+    __slots__ = (
+        'sender', 'receiver', 'amount', 'timestamp',
+        'signature', 'fee', 'data', 'transaction_id'
+    )
+    
     def __init__(
         self,
         sender: str,
@@ -59,16 +65,9 @@ class Transaction:
         Returns:
             SHA-256 hash of transaction
         """
-        data = (
-            str(self.sender) +
-            str(self.receiver) +
-            str(self.amount) +
-            str(self.timestamp) +
-            str(self.fee) +
-            str(self.data)
-        )
+        data = f"{self.sender}{self.receiver}{self.amount}{self.timestamp}{self.fee}{self.data!s}"
         
-        return sha256_hash(data)
+        return hashlib.sha256(data.encode('utf-8')).hexdigest()
     
     def sign_transaction(self, private_key: str) -> bool:
         """
@@ -3,138 +3,76 @@ ChainForgeLedger Hashing Module
 
 SHA-256 hashing implementation.
 """
-import random
+import functools
+import hashlib
+import secrets
 from typing import Union
 
-p = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEFFFFFC2F
-a = 0
-b = 7
+try:
+    from gmpy2 import invert, mpz
+except ImportError:
+    invert = None
+    mpz = int
+
+# Curve constants are GMP integers when gmpy2 is installed, so all curve
+# arithmetic derived from them runs in GMP; points handed back to callers
+# are converted to plain ints.
+p = mpz(0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEFFFFFC2F)
+a = mpz(0)
+b = mpz(7)
 
 G = (
-    0x79BE667EF9DCBBAC55A06295CE870B07029BFCDB2DCE28D959F2815B16F81798,
-    0x483ADA7726A3C4655DA4FBFC0E1108A8FD17B448A68554199C47D08FFB10D4B8
+    mpz(0x79BE667EF9DCBBAC55A06295CE870B07029BFCDB2DCE28D959F2815B16F81798),
+    mpz(0x483ADA7726A3C4655DA4FBFC0E1108A8FD17B448A68554199C47D08FFB10D4B8)
 )
 
-n = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141
+n = mpz(0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141)
+
+# Inputs hashlib consumes directly, without an intermediate copy
+_BYTES_LIKE = (bytes, bytearray, memoryview)
 
-def right_rotate(x, n):
-    return ((x >> n) | (x << (32 - n))) & 0xFFFFFFFF
 
-def sha256_hash(message: Union[str, bytes]) -> str:
+def sha256_hash(message: Union[str, bytes, memoryview]) -> str:
     """
     Calculate SHA-256 hash of the given message.
     
+    Hashing runs in hashlib (OpenSSL), which uses the CPU's SHA extensions
+    where available. Bytes-like input is hashed in place; only str is
+    encoded first.
+    
     Args:
-        message: Input message as string or bytes
+        message: Input message as string, bytes, bytearray or memoryview
         
     Returns:
         SHA-256 hash as hexadecimal string
     """
-    # Handle bytes input
-    if isinstance(message, bytes):
-        message_bytes = bytearray(message)
-    elif isinstance(message, str):
-        message_bytes = bytearray(message, 'utf-8')
-    elif isinstance(message, bytearray):
-        message_bytes = message
-    else:
-        raise TypeError("Message must be str, bytes, or bytearray")
-    
-    # Initial hash values (first 32 bits of the fractional parts of the square roots of the first 8 primes)
-    h = [
-        0x6a09e667, 0xbb67ae85, 0x3c6ef372, 0xa54ff53a,
-        0x510e527f, 0x9b05688c, 0x1f83d9ab, 0x5be0cd19
-    ]
-
-    # Round constants (first 32 bits of fractional parts of cube roots of first 64 primes)
-    k = [
-        0x428a2f98, 0x71374491, 0xb5c0fbcf, 0xe9b5dba5,
-        0x3956c25b, 0x59f111f1, 0x923f82a4, 0xab1c5ed5,
-        0xd807aa98, 0x12835b01, 0x243185be, 0x550c7dc3,
-        0x72be5d74, 0x80deb1fe, 0x9bdc06a7, 0xc19bf174,
-        0xe49b69c1, 0xefbe4786, 0x0fc19dc6, 0x240ca1cc,
-        0x2de92c6f, 0x4a7484aa, 0x5cb0a9dc, 0x76f988da,
-        0x983e5152, 0xa831c66d, 0xb00327c8, 0xbf597fc7,
-        0xc6e00bf3, 0xd5a79147, 0x06ca6351, 0x14292967,
-        0x27b70a85, 0x2e1b2138, 0x4d2c6dfc, 0x53380d13,
-        0x650a7354, 0x766a0abb, 0x81c2c92e, 0x92722c85,
-        0xa2bfe8a1, 0xa81a664b, 0xc24b8b70, 0xc76c51a3,
-        0xd192e819, 0xd6990624, 0xf40e3585, 0x106aa070,
-        0x19a4c116, 0x1e376c08, 0x2748774c, 0x34b0bcb5,
-        0x391c0cb3, 0x4ed8aa4a, 0x5b9cca4f, 0x682e6ff3,
-        0x748f82ee, 0x78a5636f, 0x84c87814, 0x8cc70208,
-        0x90befffa, 0xa4506ceb, 0xbef9a3f7, 0xc67178f2
-    ]
-
-    # Pre-processing
-    message = bytearray(message, 'utf-8')
-    bit_length = len(message) * 8
-
-    message.append(0x80)
-
-    while (len(message) * 8) % 512 != 448:
-        message.append(0)
-
-    message += bit_length.to_bytes(8, 'big')
-
-    # Process 512-bit chunks
-    for chunk_start in range(0, len(message), 64):
-        chunk = message[chunk_start:chunk_start + 64]
-        w = [0] * 64
-
-        for i in range(16):
-            w[i] = int.from_bytes(chunk[i*4:(i*4)+4], 'big')
-
-        for i in range(16, 64):
-            s0 = right_rotate(w[i-15], 7) ^ right_rotate(w[i-15], 18) ^ (w[i-15] >> 3)
-            s1 = right_rotate(w[i-2], 17) ^ right_rotate(w[i-2], 19) ^ (w[i-2] >> 10)
-            w[i] = (w[i-16] + s0 + w[i-7] + s1) & 0xFFFFFFFF
-
-        a, b, c, d, e, f, g, h_temp = h
-
-        for i in range(64):
-            S1 = right_rotate(e, 6) ^ right_rotate(e, 11) ^ right_rotate(e, 25)
-            ch = (e & f) ^ (~e & g)
-            temp1 = (h_temp + S1 + ch + k[i] + w[i]) & 0xFFFFFFFF
-            S0 = right_rotate(a, 2) ^ right_rotate(a, 13) ^ right_rotate(a, 22)
-            maj = (a & b) ^ (a & c) ^ (b & c)
-            temp2 = (S0 + maj) & 0xFFFFFFFF
-
-            h_temp = g
-            g = f
-            f = e
-            e = (d + temp1) & 0xFFFFFFFF
-            d = c
-            c = b
-            b = a
-            a = (temp1 + temp2) & 0xFFFFFFFF
-
-        h = [
-            (h[0] + a) & 0xFFFFFFFF,
-            (h[1] + b) & 0xFFFFFFFF,
-            (h[2] + c) & 0xFFFFFFFF,
-            (h[3] + d) & 0xFFFFFFFF,
-            (h[4] + e) & 0xFFFFFFFF,
-            (h[5] + f) & 0xFFFFFFFF,
-            (h[6] + g) & 0xFFFFFFFF,
-            (h[7] + h_temp) & 0xFFFFFFFF
-        ]
-
-    return ''.join(f'{value:08x}' for value in h)
-
-
-def sha256_hash_bytes(message: Union[str, bytes]) -> bytes:
+    if isinstance(message, str):
+        message = message.encode('utf-8')
+    elif not isinstance(message, _BYTES_LIKE):
+        raise TypeError("Message must be str, bytes, bytearray, or memoryview")
+
+    return hashlib.sha256(message).hexdigest()
+
+
+def sha256_hash_bytes(message: Union[str, bytes, memoryview]) -> bytes:
     """
     Calculate SHA-256 hash of the given message and return as bytes.
     
+    Use this over sha256_hash when the digest is hashed again, e.g. for
+    Merkle parents, to skip the hex round trip.
+    
     Args:
-        message: Input message as string or bytes
+        message: Input message as string, bytes, bytearray or memoryview
         
     Returns:
         SHA-256 hash as bytes
     """
-    hex_hash = sha256_hash(message)
-    return bytes.fromhex(hex_hash)
+    if isinstance(message, str):
+        message = message.encode('utf-8')
+    elif not isinstance(message, _BYTES_LIKE):
+        raise TypeError("Message must be str, bytes, bytearray, or memoryview")
+
+    return hashlib.sha256(message).digest()
 
 
 # Rotation offsets
@@ -250,6 +188,8 @@ def keccak256_hash(message: str) -> str:
 # ==========================================
 
 def inverse_mod(k, mod):
+    if invert is not None:
+        return invert(k % mod, mod)
     return pow(k % mod, -1, mod)
 
 def is_on_curve(P):
@@ -280,18 +220,194 @@ def point_add(P, Q):
     m %= p
     x3 = (m * m - x1 - x2) % p
     y3 = (m * (x1 - x3) - y1) % p
-    return (x3, y3)
+    return (int(x3), int(y3))
 
-def scalar_mult(k, P):
-    result = None
-    addend = P
+# Jacobian coordinates (X, Y, Z) represent the affine point (X/Z^2, Y/Z^3);
+# None is the point at infinity. Group operations need no inversions, so
+# scalar multiplication converts back to affine only once at the end.
 
+def _from_jacobian(J):
+    if J is None or J[2] == 0:
+        return None
+    X, Y, Z = J
+    z_inv = inverse_mod(Z, p)
+    z_inv2 = z_inv * z_inv % p
+    return (int(X * z_inv2 % p), int(Y * z_inv2 * z_inv % p))
+
+def _jacobian_double(J):
+    # dbl-2009-l (a = 0)
+    if J is None or J[2] == 0:
+        return None
+    X1, Y1, Z1 = J
+    if Y1 == 0:
+        return None
+
+    A = X1 * X1 % p
+    B = Y1 * Y1 % p
+    C = B * B % p
+    D = 2 * ((X1 + B) * (X1 + B) - A - C) % p
+    E = 3 * A % p
+    X3 = (E * E - 2 * D) % p
+    Y3 = (E * (D - X3) - 8 * C) % p
+    Z3 = 2 * Y1 * Z1 % p
+    return (X3, Y3, Z3)
+
+def _jacobian_add_affine(J, Q):
+    # madd-2007-bl: Jacobian J plus affine Q
+    if Q is None:
+        return J
+    x2, y2 = Q
+    if J is None:
+        return (x2, y2, 1)
+    X1, Y1, Z1 = J
+
+    Z1Z1 = Z1 * Z1 % p
+    U2 = x2 * Z1Z1 % p
+    S2 = y2 * Z1 * Z1Z1 % p
+    H = (U2 - X1) % p
+    r = 2 * (S2 - Y1) % p
+    if H == 0:
+        return _jacobian_double(J) if r == 0 else None
+
+    HH = H * H % p
+    I = 4 * HH % p
+    HI = H * I % p
+    V = X1 * I % p
+    X3 = (r * r - HI - 2 * V) % p
+    Y3 = (r * (V - X3) - 2 * Y1 * HI) % p
+    Z3 = ((Z1 + H) * (Z1 + H) - Z1Z1 - HH) % p
+    return (X3, Y3, Z3)
+
+def point_neg(P):
+    if P is None:
+        return None
+    x, y = P
+    return (x, int((-y) % p))
+
+# Window width of the wNAF scalar representation
+WNAF_WIDTH = 5
+
+def _wnaf(k, w):
+    # Signed digits of k, least significant first; non-zero digits are odd,
+    # below 2^(w-1) in magnitude, and separated by at least w-1 zeros
+    digits = []
     while k > 0:
         if k & 1:
-            result = point_add(result, addend)
-        addend = point_add(addend, addend)
+            d = k & ((1 << w) - 1)
+            if d >= 1 << (w - 1):
+                d -= 1 << w
+            k -= d
+        else:
+            d = 0
+        digits.append(d)
         k >>= 1
+    return digits
+
+def _odd_multiples(P, w):
+    # [P, 3P, 5P, ..., (2^(w-1) - 1)P]
+    double_P = point_add(P, P)
+    table = [P]
+    for _ in range((1 << (w - 2)) - 1):
+        table.append(point_add(table[-1], double_P))
+    return tuple(table)
+
+# Odd-multiple tables of recently verified public keys (and G); points are
+# immutable, so entries never need invalidating
+_cached_odd_multiples = functools.lru_cache(maxsize=1024)(_odd_multiples)
 
+def scalar_mult(k, P, w=WNAF_WIDTH):
+    result = None
+    if k <= 0 or P is None:
+        return result
+
+    table = _odd_multiples(P, w)
+    for d in reversed(_wnaf(k, w)):
+        result = _jacobian_double(result)
+        if d > 0:
+            result = _jacobian_add_affine(result, table[d >> 1])
+        elif d < 0:
+            result = _jacobian_add_affine(result, point_neg(table[-d >> 1]))
+
+    result = _from_jacobian(result)
+    assert is_on_curve(result)
+    return result
+
+# Fixed-base comb for G: COMB_TEETH bits of the scalar, COMB_SPACING apart,
+# are looked up together, so k*G takes COMB_SPACING - 1 doublings
+COMB_TEETH = 4
+COMB_SPACING = 64
+
+# Scalar of the comb offset point T
+COMB_OFFSET = 0x636F6D622D6F6666736574
+
+@functools.lru_cache(maxsize=None)
+def _comb_table():
+    # Entry j is T + sum(2^(b*COMB_SPACING) * G for each bit b set in j).
+    # The offset point T keeps every entry (including j = 0) a finite
+    # point, so every column costs the same double + add; the accumulated
+    # (2^COMB_SPACING - 1) * T is removed by a final correction term.
+    spans = [scalar_mult(1 << (b * COMB_SPACING), G) for b in range(COMB_TEETH)]
+    offset = scalar_mult(COMB_OFFSET, G)
+
+    table = []
+    for j in range(1 << COMB_TEETH):
+        entry = offset
+        for b in range(COMB_TEETH):
+            if (j >> b) & 1:
+                entry = point_add(entry, spans[b])
+        assert entry is not None
+        table.append(entry)
+
+    correction = point_neg(scalar_mult((1 << COMB_SPACING) - 1, offset))
+    return tuple(table), correction
+
+def _select(table, index):
+    # Constant-time table lookup: read every entry, keep the one at index
+    x = y = 0
+    for i, (entry_x, entry_y) in enumerate(table):
+        mask = -((i ^ index) == 0)
+        x |= entry_x & mask
+        y |= entry_y & mask
+    return (x, y)
+
+def fixed_base_mult(k):
+    # k*G using the precomputed comb table
+    k %= n
+    table, correction = _comb_table()
+
+    result = None
+    for i in range(COMB_SPACING - 1, -1, -1):
+        result = _jacobian_double(result)
+        column = 0
+        for b in range(COMB_TEETH):
+            column |= ((k >> (i + b * COMB_SPACING)) & 1) << b
+        result = _jacobian_add_affine(result, _select(table, column))
+
+    result = _from_jacobian(_jacobian_add_affine(result, correction))
+    assert is_on_curve(result)
+    return result
+
+def double_scalar_mult(u1, P, u2, Q, w=WNAF_WIDTH):
+    # u1*P + u2*Q with one shared doubling chain (Shamir's trick), using
+    # interleaved wNAF digits of both scalars
+    digits1 = _wnaf(max(u1, 0), w)
+    digits2 = _wnaf(max(u2, 0), w)
+    table1 = _cached_odd_multiples(P, w) if digits1 and P is not None else None
+    table2 = _cached_odd_multiples(Q, w) if digits2 and Q is not None else None
+
+    result = None
+    for i in range(max(len(digits1), len(digits2)) - 1, -1, -1):
+        result = _jacobian_double(result)
+        for digits, table in ((digits1, table1), (digits2, table2)):
+            if table is None or i >= len(digits):
+                continue
+            d = digits[i]
+            if d > 0:
+                result = _jacobian_add_affine(result, table[d >> 1])
+            elif d < 0:
+                result = _jacobian_add_affine(result, point_neg(table[-d >> 1]))
+
+    result = _from_jacobian(result)
     assert is_on_curve(result)
     return result
 
@@ -300,8 +416,8 @@ def scalar_mult(k, P):
 # ==========================================
 
 def generate_keys():
-    private_key = random.randrange(1, n)
-    public_key = scalar_mult(private_key, G)
+    private_key = secrets.randbelow(n - 1) + 1
+    public_key = fixed_base_mult(private_key)
     return private_key, public_key
 
 # ==========================================
@@ -312,8 +428,8 @@ def sign(message, private_key):
     z = int(sha256_hash(message), 16) % n
 
     while True:
-        k = random.randrange(1, n)
-        point = scalar_mult(k, G)
+        k = secrets.randbelow(n - 1) + 1
+        point = fixed_base_mult(k)
         if point is None:
             continue
 
@@ -326,7 +442,7 @@ def sign(message, private_key):
         if s != 0:
             break
 
-    return (r, s)
+    return (int(r), int(s))
 
 # ==========================================
 # Verify
@@ -343,10 +459,7 @@ def verify(message, signature, public_key):
     u1 = (z * s_inv) % n
     u2 = (r * s_inv) % n
 
-    P = point_add(
-        scalar_mult(u1, G),
-        scalar_mult(u2, public_key)
-    )
+    P = double_scalar_mult(u1, G, u2, public_key)
 
     if P is None:
         return False
@@ -159,7 +159,7 @@ class MnemonicGenerator:
         iterations = 2048
         key_length = 64
         
-        # Use custom PBKDF2 implementation (uses SHA-256 for consistency)
+        # PBKDF2-HMAC-SHA256
         hex_seed = CryptoUtils.pbkdf2(mnemonic, salt, iterations, key_length)
         # Convert hex string to bytes, ensuring we have exactly 64 bytes
         seed = bytes.fromhex(hex_seed)
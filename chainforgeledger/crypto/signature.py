@@ -4,6 +4,7 @@ ChainForgeLedger Digital Signature Module
 Digital signature implementation.
 """
 
+import hashlib
 from chainforgeledger.crypto.hashing import sha256_hash
 
 
@@ -112,3 +113,50 @@ def verify(signature: Signature, data: str, private_key: str) -> bool:
     # For now, we'll just use the same mechanism for both
     expected_signature = sha256_hash(str(data) + private_key)
     return signature.value == expected_signature
+
+
+class SigningContext:
+    """
+    Reusable signing state for a single private key.
+    
+    The key is encoded once up front so repeated sign and verify calls only
+    encode and hash the data. Produces the same values as sign() and verify().
+    
+    Attributes:
+        private_key: Private key the context signs with
+    """
+    
+    def __init__(self, private_key: str):
+        """
+        Initialize a new SigningContext instance.
+        
+        Args:
+            private_key: Private key to sign with
+        """
+        self.private_key = private_key
+        self._key_bytes = private_key.encode('utf-8')
+    
+    def sign(self, data: str) -> str:
+        """
+        Sign data with the context's private key.
+        
+        Args:
+            data: Data to sign
+            
+        Returns:
+            Signature value
+        """
+        return hashlib.sha256(str(data).encode('utf-8') + self._key_bytes).hexdigest()
+    
+    def verify(self, signature: Signature, data: str) -> bool:
+        """
+        Verify a signature made with the context's private key.
+        
+        Args:
+            signature: Signature to verify
+            data: Data to verify
+            
+        Returns:
+            True if signature is valid
+        """
+        return signature.value == self.sign(data)
@@ -6,7 +6,7 @@ Wallet implementation for managing keys and transactions.
 
 from typing import List
 from chainforgeledger.crypto.keys import generate_keys, KeyPair
-from chainforgeledger.crypto.signature import sign, verify, Signature
+from chainforgeledger.crypto.signature import Signature, SigningContext
 
 
 class Wallet:
@@ -16,6 +16,10 @@ class Wallet:
     Attributes:
         key_pair: Key pair
         address: Wallet address (hash of public key)
+        short_address: First 12 characters of the address, for display
+    
+    Signing state is derived from key_pair once; call _rebuild_ctx() after
+    replacing or mutating key_pair.
     """
     
     def __init__(self):
@@ -23,6 +27,22 @@ class Wallet:
         self.key_pair, self.address = generate_keys()
         self.balance = 0.0
         self.transaction_history = []
+        self._rebuild_ctx()
+    
+    @property
+    def address(self) -> str:
+        """Wallet address (hash of public key)."""
+        return self._address
+    
+    @address.setter
+    def address(self, value: str):
+        self._address = value
+        # Display prefix is derived once per assignment, not per log line
+        self.short_address = value[:12]
+    
+    def _rebuild_ctx(self):
+        """Derive the cached signing context from the current key pair."""
+        self._signing_ctx = SigningContext(self.key_pair.private_key)
     
     @staticmethod
     def from_key_pair(key_pair: KeyPair) -> "Wallet":
@@ -40,6 +60,7 @@ class Wallet:
         wallet.address = ""
         wallet.balance = 0.0
         wallet.transaction_history = []
+        wallet._rebuild_ctx()
         
         return wallet
     
@@ -53,7 +74,7 @@ class Wallet:
         Returns:
             Signature instance
         """
-        signature_value = sign(transaction_data, self.key_pair.private_key)
+        signature_value = self._signing_ctx.sign(transaction_data)
         return Signature(signature_value, self.key_pair.public_key)
     
     def verify_transaction(self, transaction_data: str, signature: Signature) -> bool:
@@ -67,7 +88,7 @@ class Wallet:
         Returns:
             True if signature is valid
         """
-        return verify(signature, transaction_data, self.key_pair.private_key)
+        return self._signing_ctx.verify(signature, transaction_data)
     
     def add_transaction(self, transaction: dict):
         """
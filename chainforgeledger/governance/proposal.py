@@ -6,7 +6,7 @@ Proposal management for blockchain governance.
 
 import time
 import json
-from typing import Dict
+from typing import Dict, List
 from chainforgeledger.utils.logger import get_logger
 from chainforgeledger.crypto.hashing import sha256_hash
 
@@ -62,6 +62,29 @@ class Proposal:
         self.logger = get_logger(__name__)
         # Initialize the voted addresses set for O(1) lookups
         self._voted_addresses = set(v["voter_address"] for v in self.votes)
+        # Running vote tallies, kept in step with add_vote
+        self._vote_counts = self._tally_votes(self.votes)
+    
+    @staticmethod
+    def _tally_votes(votes: List[Dict]) -> Dict:
+        """
+        Sum voting power per vote choice.
+        
+        Args:
+            votes: Votes to tally
+            
+        Returns:
+            Vote count dictionary
+        """
+        vote_counts = {"yes": 0, "no": 0, "abstain": 0, "total": 0}
+        
+        for vote in votes:
+            vote_type = vote["vote"]
+            if vote_type in vote_counts:
+                vote_counts[vote_type] += vote["voting_power"]
+            vote_counts["total"] += vote["voting_power"]
+        
+        return vote_counts
     
     def _get_current_timestamp(self) -> float:
         """Get current timestamp in seconds."""
@@ -173,6 +196,9 @@ class Proposal:
         
         self.votes.append(new_vote)
         self._voted_addresses.add(voter_address)
+        if new_vote["vote"] in self._vote_counts:
+            self._vote_counts[new_vote["vote"]] += voting_power
+        self._vote_counts["total"] += voting_power
         self.updated_at = self._get_current_timestamp()
         
         self.logger.debug(f"Vote added to proposal {self.proposal_id}: {voter_address} voted {vote}")
@@ -184,15 +210,7 @@ class Proposal:
         Returns:
             Vote count dictionary
         """
-        vote_counts = {"yes": 0, "no": 0, "abstain": 0, "total": 0}
-        
-        for vote in self.votes:
-            vote_type = vote["vote"]
-            if vote_type in vote_counts:
-                vote_counts[vote_type] += vote["voting_power"]
-            vote_counts["total"] += vote["voting_power"]
-        
-        return vote_counts
+        return dict(self._vote_counts)
     
     def get_vote_percentage(self) -> Dict:
         """
@@ -4,33 +4,53 @@ ChainForgeLedger Mempool Module
 Transaction mempool management implementation.
 """
 
+import heapq
+import itertools
+import threading
 import time
-from typing import List, Optional
+from typing import Dict, List, Optional
 from chainforgeledger.utils.logger import get_logger
 from chainforgeledger.core.transaction import Transaction
+from chainforgeledger.runtime.executor import get_pool
 
 
 class MemPool:
     """
     Manages pending transactions in the mempool.
     
+    Transactions are stored in an insertion-ordered map keyed by ID, with a
+    fee-ordered heap for block selection and a per-sender index alongside.
+    Removed transactions are dropped from the heap lazily.
+    
     Attributes:
         transactions: List of pending transactions
         max_size: Maximum number of transactions to keep
     """
     
-    def __init__(self, max_size: int = 1000):
+    def __init__(self, max_size: int = 1000, num_validators: int = 1):
         """
         Initialize a new MemPool instance.
         
         Args:
             max_size: Maximum number of transactions to keep
+            num_validators: Validate add_many batches on the shared
+                verification pool when greater than one
         """
-        self.transactions = []
         self._transaction_map = {}  # For O(1) transaction lookups by ID
+        self._fee_heap = []  # (-fee, sequence, transaction) entries
+        self._heap_sequence = {}  # Transaction ID -> sequence of its live heap entry
+        self._sequence = itertools.count()
+        self._by_sender: Dict[str, Dict[str, Transaction]] = {}
         self.max_size = max_size
+        self.num_validators = num_validators
+        self._lock = threading.Lock()
         self.logger = get_logger(__name__)
     
+    @property
+    def transactions(self) -> List[Transaction]:
+        """Pending transactions in insertion order."""
+        return list(self._transaction_map.values())
+    
     def add_transaction(self, transaction: Transaction) -> bool:
         """
         Add a transaction to the mempool.
@@ -50,7 +70,7 @@ class MemPool:
             return False
         
         # Check mempool size
-        if len(self.transactions) >= self.max_size:
+        if len(self._transaction_map) >= self.max_size:
             self.logger.warning("Mempool is full")
             return False
         
@@ -59,9 +79,70 @@ class MemPool:
             self.logger.warning(f"Invalid transaction: {transaction.transaction_id}")
             return False
         
-        self.transactions.append(transaction)
-        self._transaction_map[transaction.transaction_id] = transaction
-        self.logger.debug(f"Transaction added to mempool: {transaction.transaction_id}")
+        with self._lock:
+            return self._insert(transaction)
+    
+    def add_many(self, transactions: List[Transaction]) -> int:
+        """
+        Validate a batch of transactions and add the valid ones.
+        
+        With num_validators above one, validation runs on the shared pool;
+        the valid transactions are then inserted in their original order
+        under a single lock acquisition.
+        
+        Args:
+            transactions: Transactions to add
+            
+        Returns:
+            Number of transactions added
+        """
+        for transaction in transactions:
+            if not isinstance(transaction, Transaction):
+                raise ValueError("Invalid transaction type")
+        
+        candidates = [tx for tx in transactions if tx.transaction_id not in self._transaction_map]
+        
+        if self.num_validators > 1 and len(candidates) > 1:
+            results = list(get_pool().map(self._validate_transaction, candidates))
+        else:
+            results = [self._validate_transaction(tx) for tx in candidates]
+        
+        added = 0
+        with self._lock:
+            for transaction, is_valid in zip(candidates, results):
+                if not is_valid:
+                    self.logger.warning(f"Invalid transaction: {transaction.transaction_id}")
+                    continue
+                if self._insert(transaction):
+                    added += 1
+        
+        return added
+    
+    def _insert(self, transaction: Transaction) -> bool:
+        """
+        Insert a validated transaction; the caller holds the lock.
+        
+        Args:
+            transaction: Transaction to insert
+            
+        Returns:
+            True if inserted, False if it is a duplicate or the pool is full
+        """
+        transaction_id = transaction.transaction_id
+        if transaction_id in self._transaction_map:
+            self.logger.debug(f"Transaction already exists in mempool: {transaction_id}")
+            return False
+        
+        if len(self._transaction_map) >= self.max_size:
+            self.logger.warning("Mempool is full")
+            return False
+        
+        sequence = next(self._sequence)
+        self._transaction_map[transaction_id] = transaction
+        self._heap_sequence[transaction_id] = sequence
+        heapq.heappush(self._fee_heap, (-transaction.fee, sequence, transaction))
+        self._by_sender.setdefault(transaction.sender, {})[transaction_id] = transaction
+        self.logger.debug(f"Transaction added to mempool: {transaction_id}")
         return True
     
     def remove_transaction(self, transaction: Transaction) -> bool:
@@ -80,8 +161,14 @@ class MemPool:
         transaction_id = transaction.transaction_id
         
         if transaction_id in self._transaction_map:
-            del self._transaction_map[transaction_id]
-            self.transactions = [tx for tx in self.transactions if tx.transaction_id != transaction_id]
+            removed = self._transaction_map.pop(transaction_id)
+            del self._heap_sequence[transaction_id]
+            sender_transactions = self._by_sender[removed.sender]
+            del sender_transactions[transaction_id]
+            if not sender_transactions:
+                del self._by_sender[removed.sender]
+            if len(self._fee_heap) > 2 * len(self._transaction_map) + 64:
+                self._rebuild_fee_heap()
             self.logger.debug(f"Transaction removed from mempool: {transaction_id}")
             return True
         
@@ -123,9 +210,9 @@ class MemPool:
             List of transactions
         """
         if count is None:
-            return self.transactions.copy()
+            return self.transactions
         
-        return self.transactions[:count]
+        return list(itertools.islice(self._transaction_map.values(), count))
     
     def get_transactions_by_sender(self, sender_address: str) -> List[Transaction]:
         """
@@ -137,7 +224,7 @@ class MemPool:
         Returns:
             List of transactions from the specified sender
         """
-        return [tx for tx in self.transactions if tx.sender == sender_address]
+        return list(self._by_sender.get(sender_address, {}).values())
     
     def get_transactions_by_recipient(self, recipient_address: str) -> List[Transaction]:
         """
@@ -236,31 +323,49 @@ class MemPool:
         Returns:
             List of transactions to include in block
         """
-        # Sort transactions by fee descending to prioritize high fee transactions
-        sorted_transactions = self.get_transactions_sorted_by_fee(ascending=False)
-        
         selected = []
-        total_size = 0
+        popped = []
         
-        for tx in sorted_transactions:
-            if block_size_limit and total_size >= block_size_limit:
+        # Pop the heap in fee order, skipping entries of removed transactions
+        while self._fee_heap:
+            if block_size_limit and len(selected) >= block_size_limit:
                 break
                 
             if block_transaction_limit and len(selected) >= block_transaction_limit:
                 break
+            
+            entry = heapq.heappop(self._fee_heap)
+            tx = entry[2]
+            if self._heap_sequence.get(tx.transaction_id) != entry[1]:
+                continue
+            popped.append(entry)
                 
             # Check if transaction is still valid
             if self._validate_transaction(tx):
                 selected.append(tx)
-                total_size += 1
+        
+        # Selection does not remove transactions, so restore their entries
+        for entry in popped:
+            heapq.heappush(self._fee_heap, entry)
         
         return selected
     
     def clear(self):
         """Clear all transactions from mempool."""
-        self.transactions.clear()
+        self._transaction_map.clear()
+        self._fee_heap.clear()
+        self._heap_sequence.clear()
+        self._by_sender.clear()
         self.logger.debug("Mempool cleared")
     
+    def _rebuild_fee_heap(self):
+        """Rebuild the fee heap from live transactions, dropping stale entries."""
+        self._fee_heap = [
+            (-tx.fee, self._heap_sequence[transaction_id], tx)
+            for transaction_id, tx in self._transaction_map.items()
+        ]
+        heapq.heapify(self._fee_heap)
+    
     def _validate_transaction(self, transaction: Transaction) -> bool:
         """
         Validate a transaction before adding to mempool.
@@ -296,20 +401,21 @@ class MemPool:
         Returns:
             Mempool information dictionary
         """
+        transactions = self.transactions
         fee_sorted = self.get_transactions_sorted_by_fee()
         fee_ranges = self._calculate_fee_ranges()
         
         return {
-            "size": len(self.transactions),
+            "size": len(transactions),
             "max_size": self.max_size,
-            "utilization": len(self.transactions) / self.max_size,
-            "transaction_count": len(self.transactions),
-            "average_fee": sum(tx.fee for tx in self.transactions) / len(self.transactions) if self.transactions else 0,
-            "min_fee": min(tx.fee for tx in self.transactions) if self.transactions else 0,
-            "max_fee": max(tx.fee for tx in self.transactions) if self.transactions else 0,
+            "utilization": len(transactions) / self.max_size,
+            "transaction_count": len(transactions),
+            "average_fee": sum(tx.fee for tx in transactions) / len(transactions) if transactions else 0,
+            "min_fee": min(tx.fee for tx in transactions) if transactions else 0,
+            "max_fee": max(tx.fee for tx in transactions) if transactions else 0,
             "fee_ranges": fee_ranges,
             "top_fees": fee_sorted[:10],
-            "total_amount": sum(tx.amount for tx in self.transactions) if self.transactions else 0,
+            "total_amount": sum(tx.amount for tx in transactions) if transactions else 0,
             "time_range": self._get_time_range()
         }
     
@@ -328,7 +434,7 @@ class MemPool:
             "very_high": 0
         }
         
-        for tx in self.transactions:
+        for tx in self._transaction_map.values():
             fee = tx.fee
             
             if fee < 0.001:
@@ -351,14 +457,14 @@ class MemPool:
         Returns:
             Time range dictionary
         """
-        if not self.transactions:
+        if not self._transaction_map:
             return {
                 "earliest": None,
                 "latest": None,
                 "range": 0
             }
         
-        timestamps = [tx.timestamp for tx in self.transactions]
+        timestamps = [tx.timestamp for tx in self._transaction_map.values()]
         earliest = min(timestamps)
         latest = max(timestamps)
         
@@ -376,7 +482,7 @@ class MemPool:
             Dictionary representation of mempool
         """
         return {
-            "transactions": [tx.to_dict() for tx in self.transactions],
+            "transactions": [tx.to_dict() for tx in self._transaction_map.values()],
             "max_size": self.max_size
         }
     
@@ -401,7 +507,7 @@ class MemPool:
     
     def __len__(self) -> int:
         """Get number of transactions in mempool."""
-        return len(self.transactions)
+        return len(self._transaction_map)
     
     def __repr__(self):
         """String representation of mempool."""
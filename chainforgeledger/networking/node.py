@@ -4,11 +4,14 @@ ChainForgeLedger Node Module
 Node implementation for blockchain network communication.
 """
 
-import time
+import asyncio
 import random
+import time
+from typing import Dict, List
 from chainforgeledger.networking.peer import Peer
 from chainforgeledger.networking.protocol import Protocol
 from chainforgeledger.networking.mempool import MemPool
+from chainforgeledger.utils import fastjson
 
 
 class Node:
@@ -36,22 +39,29 @@ class Node:
         self.node_id = node_id
         self.address = address
         self.port = port
-        self.peers = []
+        self._peers: Dict[str, Peer] = {}  # Node ID -> peer, one entry per node
         self.mempool = MemPool()
         self.protocol = Protocol()
         self.is_running = False
         self.start_time = None
     
+    @property
+    def peers(self) -> List[Peer]:
+        """Connected peers in connection order."""
+        return list(self._peers.values())
+    
     def connect(self, peer: "Node"):
         """
         Connect to a peer node.
         
+        Connecting to an already connected node replaces its peer entry
+        rather than adding a duplicate.
+        
         Args:
             peer: Peer node to connect to
         """
-        peer_info = Peer(peer.node_id, peer.address, peer.port)
-        self.peers.append(peer_info)
-        peer.peers.append(Peer(self.node_id, self.address, self.port))
+        self._peers[peer.node_id] = Peer(peer.node_id, peer.address, peer.port)
+        peer._peers[self.node_id] = Peer(self.node_id, self.address, self.port)
     
     def disconnect(self, peer: "Node"):
         """
@@ -60,18 +70,37 @@ class Node:
         Args:
             peer: Peer node to disconnect from
         """
-        self.peers = [p for p in self.peers if p.node_id != peer.node_id]
-        peer.peers = [p for p in peer.peers if p.node_id != self.node_id]
+        self._peers.pop(peer.node_id, None)
+        peer._peers.pop(self.node_id, None)
     
     def broadcast(self, message: dict):
         """
         Broadcast a message to all connected peers.
         
+        Deliveries run concurrently, so the call takes as long as the slowest
+        peer rather than the sum over all peers. Called from inside a running
+        event loop, the broadcast is scheduled on that loop instead.
+        
         Args:
             message: Message to broadcast
+            
+        Returns:
+            The scheduled task when called inside an event loop, else None
         """
-        for peer in self.peers:
-            self.send_message(peer.node_id, message)
+        return self._run(self.broadcast_async(message))
+    
+    async def broadcast_async(self, message: dict):
+        """
+        Broadcast a message to all connected peers concurrently.
+        
+        The message is encoded once and the same payload is handed to
+        every peer.
+        
+        Args:
+            message: Message to broadcast
+        """
+        payload = fastjson.dumps_bytes(message, default=str)
+        await asyncio.gather(*(self._deliver(peer, message, payload) for peer in self._peers.values()))
     
     def send_message(self, recipient_node_id: str, message: dict):
         """
@@ -80,15 +109,47 @@ class Node:
         Args:
             recipient_node_id: Recipient node ID
             message: Message to send
+            
+        Returns:
+            The scheduled task when called inside an event loop, else None
         """
-        peer = next((p for p in self.peers if p.node_id == recipient_node_id), None)
+        peer = self._peers.get(recipient_node_id)
         if peer:
-            # Simulate network delay
-            time.sleep(random.uniform(0.001, 0.01))
-            # For demo purposes, just print the message
-            print(f"Node {self.node_id} sent to {recipient_node_id}: {message.get('type')}")
-        else:
-            print(f"Node {self.node_id}: Peer {recipient_node_id} not found")
+            return self._run(self._deliver(peer, message, fastjson.dumps_bytes(message, default=str)))
+        print(f"Node {self.node_id}: Peer {recipient_node_id} not found")
+        return None
+    
+    @staticmethod
+    def _run(coroutine):
+        """
+        Run a coroutine to completion, or schedule it if a loop is already running.
+        
+        Args:
+            coroutine: Coroutine to run
+            
+        Returns:
+            The scheduled task when called inside an event loop, else None
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            asyncio.run(coroutine)
+            return None
+        return loop.create_task(coroutine)
+    
+    async def _deliver(self, peer: Peer, message: dict, payload: bytes):
+        """
+        Deliver a message to an already resolved peer.
+        
+        Args:
+            peer: Recipient peer
+            message: Message to send
+            payload: Encoded message as sent over the wire
+        """
+        # Simulate network delay
+        await asyncio.sleep(random.uniform(0.001, 0.01))
+        # For demo purposes, just print the message
+        print(f"Node {self.node_id} sent to {peer.node_id}: {message.get('type')} ({len(payload)} bytes)")
     
     def receive_message(self, sender_node_id: str, message: dict):
         """
@@ -162,7 +223,7 @@ class Node:
     
     def is_connected(self) -> bool:
         """Check if node is connected to network."""
-        return self.is_running and len(self.peers) > 0
+        return self.is_running and len(self._peers) > 0
     
     def get_node_info(self) -> dict:
         """
@@ -176,8 +237,8 @@ class Node:
             "address": self.address,
             "port": self.port,
             "status": "running" if self.is_running else "stopped",
-            "peers": len(self.peers),
-            "transactions_in_mempool": len(self.mempool.transactions),
+            "peers": len(self._peers),
+            "transactions_in_mempool": len(self.mempool),
             "uptime": int(time.time() - self.start_time) if self.start_time else 0
         }
     
@@ -192,7 +253,7 @@ class Node:
             "node_id": self.node_id,
             "address": self.address,
             "port": self.port,
-            "peers": [p.to_dict() for p in self.peers],
+            "peers": [p.to_dict() for p in self._peers.values()],
             "mempool": self.mempool.to_dict(),
             "is_running": self.is_running,
             "start_time": self.start_time
@@ -213,7 +274,7 @@ class Node:
         
         for peer_data in data.get("peers", []):
             peer = Peer.from_dict(peer_data)
-            node.peers.append(peer)
+            node._peers[peer.node_id] = peer
             
         node.is_running = data.get("is_running", False)
         node.start_time = data.get("start_time")
@@ -222,7 +283,7 @@ class Node:
     
     def __repr__(self):
         """String representation of node."""
-        return f"Node(node_id={self.node_id}, address={self.address}:{self.port}, peers={len(self.peers)})"
+        return f"Node(node_id={self.node_id}, address={self.address}:{self.port}, peers={len(self._peers)})"
     
     def __str__(self):
         """String representation for printing."""
@@ -6,16 +6,52 @@ Comprehensive runtime environment for blockchain operations including:
 - Gas and fee management
 - Plugin system for extensibility
 - State machine for deterministic transitions
+- Shared worker pool for parallel verification
 """
 
-from chainforgeledger.runtime.events import EventSystem, Event
-from chainforgeledger.runtime.gas import GasSystem, GasConfig, GasMetrics
-from chainforgeledger.runtime.plugins import PluginSystem, Plugin, PluginInfo, PluginConfig
-from chainforgeledger.runtime.state_machine import StateMachine, StateSnapshot, ExecutionResult
+import importlib
+
+# Exports are imported on first access (PEP 562), so importing one runtime
+# submodule, e.g. the shared executor, does not load the state machine and
+# its crypto dependencies
+_LAZY = {
+    "EventSystem": "chainforgeledger.runtime.events",
+    "Event": "chainforgeledger.runtime.events",
+    "get_pool": "chainforgeledger.runtime.executor",
+    "configure_pool": "chainforgeledger.runtime.executor",
+    "GasSystem": "chainforgeledger.runtime.gas",
+    "GasConfig": "chainforgeledger.runtime.gas",
+    "GasMetrics": "chainforgeledger.runtime.gas",
+    "PluginSystem": "chainforgeledger.runtime.plugins",
+    "Plugin": "chainforgeledger.runtime.plugins",
+    "PluginInfo": "chainforgeledger.runtime.plugins",
+    "PluginConfig": "chainforgeledger.runtime.plugins",
+    "StateMachine": "chainforgeledger.runtime.state_machine",
+    "StateSnapshot": "chainforgeledger.runtime.state_machine",
+    "ExecutionResult": "chainforgeledger.runtime.state_machine",
+}
+
+
+def __getattr__(name):
+    """Import an exported name from its submodule on first access."""
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """List module attributes including not yet imported exports."""
+    return sorted(set(globals()) | set(_LAZY))
+
 
 __all__ = [
     "EventSystem", "Event",
     "GasSystem", "GasConfig", "GasMetrics",
     "PluginSystem", "Plugin", "PluginInfo", "PluginConfig",
-    "StateMachine", "StateSnapshot", "ExecutionResult"
+    "StateMachine", "StateSnapshot", "ExecutionResult",
+    "get_pool", "configure_pool"
 ]
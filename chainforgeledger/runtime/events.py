@@ -13,7 +13,8 @@ Features:
 """
 
 import time
-from typing import Dict, List, Optional, Set, Callable, Any
+from collections import deque
+from typing import Deque, Dict, List, Optional, Set, Callable, Any, Tuple
 from dataclasses import dataclass, field
 
 
@@ -34,9 +35,10 @@ class EventSystem:
     def __init__(self, options: Dict = None):
         options = options or {}
         self.subscribers: Dict[str, List[Callable]] = {}
-        self.event_history: List[Event] = []
         self.max_history_size = options.get('maxHistorySize', 10000)
-        self.event_queue: List[Event] = []
+        # Ring buffer: the oldest event drops off in O(1) once full
+        self.event_history: Deque[Event] = deque(maxlen=self.max_history_size)
+        self.event_queue: Deque[Event] = deque()
         self.processing_queue = False
         self.event_types: Set[str] = {
             'block.created',
@@ -127,6 +129,17 @@ class EventSystem:
     
     def publish(self, event_type: str, data: Dict[str, Any]):
         """Publish an event"""
+        self._enqueue(event_type, data)
+        self._process_queue()
+    
+    def publish_batch(self, events: List[Tuple[str, Dict[str, Any]]]):
+        """Publish several (event_type, data) events, dispatching them in one queue pass"""
+        for event_type, data in events:
+            self._enqueue(event_type, data)
+        self._process_queue()
+    
+    def _enqueue(self, event_type: str, data: Dict[str, Any]):
+        """Validate an event and add it to the history and processing queue"""
         # Validate event type
         if event_type not in self.event_types:
             raise ValueError(f"Unknown event type: {event_type}")
@@ -139,12 +152,9 @@ class EventSystem:
         
         # Add to history
         self.event_history.append(event)
-        if len(self.event_history) > self.max_history_size:
-            self.event_history.pop(0)
         
         # Add to processing queue
         self.event_queue.append(event)
-        self._process_queue()
     
     def _validate_event_data(self, event_type: str, data: Dict[str, Any]):
         """Validate event data against schema"""
@@ -180,7 +190,7 @@ class EventSystem:
         self.processing_queue = True
         
         while self.event_queue:
-            event = self.event_queue.pop(0)
+            event = self.event_queue.popleft()
             
             # Notify subscribers
             if event.event_type in self.subscribers:
@@ -0,0 +1,61 @@
+"""
+Executor - Shared verification worker pool
+
+A single thread pool shared by every parallel verification path (chain
+validation, block signature checks, mempool admission and state machine
+verification), so subsystems do not each spawn their own threads and
+oversubscribe the CPU.
+"""
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+
+_POOL: Optional[ThreadPoolExecutor] = None
+_POOL_WORKERS = 0
+_POOL_LOCK = threading.Lock()
+
+
+def _create_pool(workers: int = None) -> ThreadPoolExecutor:
+    """Create a pool and publish it as the shared one; the caller holds _POOL_LOCK"""
+    global _POOL, _POOL_WORKERS
+    workers = workers or os.cpu_count() or 1
+    _POOL = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="cfl-verify")
+    _POOL_WORKERS = workers
+    return _POOL
+
+
+def get_pool() -> ThreadPoolExecutor:
+    """Get the shared verification pool, creating it on first use"""
+    pool = _POOL
+    if pool is not None:
+        return pool
+
+    with _POOL_LOCK:
+        # Another thread may have created the pool while this one waited
+        if _POOL is None:
+            _create_pool()
+        return _POOL
+
+
+def configure_pool(workers: int = None) -> ThreadPoolExecutor:
+    """
+    Size the shared verification pool, replacing any existing one
+    workers defaults to the number of CPUs; tasks already submitted to a
+    replaced pool still run to completion
+    """
+    with _POOL_LOCK:
+        previous = _POOL
+        pool = _create_pool(workers)
+
+    if previous is not None:
+        previous.shutdown(wait=False)
+    return pool
+
+
+def get_pool_size() -> int:
+    """Get the number of worker threads in the shared pool"""
+    get_pool()
+    return _POOL_WORKERS
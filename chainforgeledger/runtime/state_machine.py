@@ -10,10 +10,13 @@ A robust state machine implementation for blockchain operations. Features includ
 - Light client support
 """
 
+import asyncio
 import time
-from typing import Dict, List, Optional, Tuple, Any
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple, Any
 from dataclasses import dataclass, field
 from chainforgeledger.crypto.hashing import sha256_hash
+from chainforgeledger.runtime.executor import get_pool
 
 
 @dataclass
@@ -59,6 +62,13 @@ class StateMachine:
         self.snapshots: Dict[int, StateSnapshot] = {}
         self.current_block_number = 0
         self.state_root = self._calculate_state_root()
+        self._write_lock: Optional[asyncio.Lock] = None
+    
+    def _get_write_lock(self) -> asyncio.Lock:
+        """Get the write lock, creating it inside the running event loop"""
+        if self._write_lock is None:
+            self._write_lock = asyncio.Lock()
+        return self._write_lock
     
     def _calculate_state_root(self) -> str:
         """Calculate Merkle root of current state"""
@@ -78,23 +88,16 @@ class StateMachine:
         )
         
         try:
-            # Check if sender exists
-            if transaction.from_address not in self.state['accounts']:
-                raise Exception("Sender account not found")
-            
-            # Check sender balance
-            if self.state['accounts'][transaction.from_address]['balance'] < transaction.value:
-                raise Exception("Insufficient balance")
-            
-            # Check gas limit
-            if transaction.gas_limit < 21000:
-                raise Exception("Gas limit too low")
-            
-            # Apply transaction
-            await self._execute_transaction(transaction)
-            
-            # Update state root
-            self.state_root = self._calculate_state_root()
+            async with self._get_write_lock():
+                error = self._verify_transaction(transaction, self.state['accounts'])
+                if error:
+                    raise Exception(error)
+                
+                # Apply transaction
+                await self._execute_transaction(transaction)
+                
+                # Update state root
+                self.state_root = self._calculate_state_root()
             
             result.success = True
             result.state_root = self.state_root
@@ -105,6 +108,88 @@ class StateMachine:
         
         return result
     
+    @staticmethod
+    def _verify_transaction(transaction: Any, accounts: Mapping[str, Dict]) -> Optional[str]:
+        """Check a transaction against account state, returning an error or None"""
+        # Check if sender exists
+        if transaction.from_address not in accounts:
+            return "Sender account not found"
+        
+        # Check sender balance
+        if accounts[transaction.from_address]['balance'] < transaction.value:
+            return "Insufficient balance"
+        
+        # Check gas limit
+        if transaction.gas_limit < 21000:
+            return "Gas limit too low"
+        
+        return None
+    
+    def freeze(self) -> Mapping[str, Dict]:
+        """Get a read-only view of the accounts for concurrent lookups"""
+        return MappingProxyType(self.state['accounts'])
+    
+    def verify_transactions_parallel(self, transactions: List[Any]) -> List[Optional[str]]:
+        """
+        Verify transactions on the shared pool against a frozen view of the accounts
+        Returns one error message (or None) per transaction, in order
+        """
+        frozen = self.freeze()
+        return list(get_pool().map(lambda tx: self._verify_transaction(tx, frozen), transactions))
+    
+    async def apply_batch(self, transactions: List[Any]) -> List[ExecutionResult]:
+        """
+        Apply transactions after verifying them in parallel
+        Verification runs on the shared pool without blocking the event loop;
+        transactions are then applied serially under the write lock, with the
+        senders of accounts touched earlier in the batch re-verified against
+        the live state, so results match applying the batch one by one. The
+        state root is recalculated once for the whole batch
+        """
+        results = []
+        touched = set()
+        
+        async with self._get_write_lock():
+            loop = asyncio.get_running_loop()
+            pool = get_pool()
+            frozen = self.freeze()
+            errors = await asyncio.gather(*(
+                loop.run_in_executor(pool, self._verify_transaction, transaction, frozen)
+                for transaction in transactions
+            ))
+            
+            for transaction, error in zip(transactions, errors):
+                result = ExecutionResult(
+                    success=False,
+                    state_root=self.state_root,
+                    gas_used=0,
+                    gas_limit=transaction.gas_limit
+                )
+                
+                # Earlier transactions in the batch may have spent or funded this sender
+                if transaction.from_address in touched:
+                    error = self._verify_transaction(transaction, self.state['accounts'])
+                if error:
+                    result.error = error
+                else:
+                    try:
+                        await self._execute_transaction(transaction)
+                        touched.add(transaction.from_address)
+                        touched.add(transaction.to_address or self._calculate_contract_address(transaction))
+                        result.success = True
+                        result.gas_used = transaction.gas_limit // 2  # Estimate gas usage
+                    except Exception as e:
+                        result.error = str(e)
+                results.append(result)
+            
+            self.state_root = self._calculate_state_root()
+        
+        for result in results:
+            if result.success:
+                result.state_root = self.state_root
+        
+        return results
+    
     async def _execute_transaction(self, transaction: Any):
         """Execute transaction logic"""
         if transaction.to_address:
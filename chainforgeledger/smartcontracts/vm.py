@@ -4,7 +4,8 @@ ChainForgeLedger Virtual Machine
 Smart contract virtual machine implementation with bytecode execution.
 """
 
-from typing import Any, Dict, List
+import functools
+from typing import Any, Callable, Dict, List
 from chainforgeledger.utils.logger import get_logger
 from chainforgeledger.crypto.hashing import sha256_hash
 
@@ -78,6 +79,9 @@ class VirtualMachine:
     # Reverse opcode mapping for debugging
     OPCODE_NAMES = {v: k for k, v in OPCODES.items()}
     
+    # Opcodes whose handlers read operands from the instruction stream
+    OPERAND_OPCODES = frozenset({"PUSH", "JMP", "JMPIF", "JMPIFNOT", "CALL", "LOG", "ASSERT"})
+    
     def __init__(self, max_gas: int = 1000000):
         """
         Initialize a new VirtualMachine instance.
@@ -139,58 +143,21 @@ class VirtualMachine:
             # Convert bytecode string to list of integers
             instructions = self._parse_bytecode(bytecode)
             
-            while self.running and self.pc < len(instructions):
+            dispatch = self._build_dispatch_table(instructions)
+            return_opcode = self.OPCODES["RETURN"]
+            instruction_count = len(instructions)
+            
+            while self.running and self.pc < instruction_count:
                 opcode = instructions[self.pc]
                 self.pc += 1
                 
-                if opcode == self.OPCODES["NOP"]:
-                    self._execute_nop()
-                elif opcode == self.OPCODES["PUSH"]:
-                    self._execute_push(instructions)
-                elif opcode == self.OPCODES["POP"]:
-                    self._execute_pop()
-                elif opcode == self.OPCODES["ADD"]:
-                    self._execute_add()
-                elif opcode == self.OPCODES["SUB"]:
-                    self._execute_sub()
-                elif opcode == self.OPCODES["MUL"]:
-                    self._execute_mul()
-                elif opcode == self.OPCODES["DIV"]:
-                    self._execute_div()
-                elif opcode == self.OPCODES["EQ"]:
-                    self._execute_eq()
-                elif opcode == self.OPCODES["LT"]:
-                    self._execute_lt()
-                elif opcode == self.OPCODES["GT"]:
-                    self._execute_gt()
-                elif opcode == self.OPCODES["JMP"]:
-                    self._execute_jmp(instructions)
-                elif opcode == self.OPCODES["JMPIF"]:
-                    self._execute_jmpif(instructions)
-                elif opcode == self.OPCODES["JMPIFNOT"]:
-                    self._execute_jmpifnot(instructions)
-                elif opcode == self.OPCODES["STORE"]:
-                    self._execute_store()
-                elif opcode == self.OPCODES["LOAD"]:
-                    self._execute_load()
-                elif opcode == self.OPCODES["MSTORE"]:
-                    self._execute_mstore()
-                elif opcode == self.OPCODES["MLOAD"]:
-                    self._execute_mload()
-                elif opcode == self.OPCODES["CALL"]:
-                    self._execute_call(instructions)
-                elif opcode == self.OPCODES["RETURN"]:
+                if opcode == return_opcode:
                     return self._execute_return()
-                elif opcode == self.OPCODES["SHA256"]:
-                    self._execute_sha256()
-                elif opcode == self.OPCODES["LOG"]:
-                    self._execute_log(instructions)
-                elif opcode == self.OPCODES["ASSERT"]:
-                    self._execute_assert(instructions)
-                elif opcode == self.OPCODES["HALT"]:
-                    self._execute_halt()
-                else:
+                
+                handler = dispatch.get(opcode)
+                if handler is None:
                     raise ValueError(f"Unknown opcode: {opcode}")
+                handler()
         
         except Exception as e:
             self.logger.error(f"Execution error: {e}")
@@ -199,6 +166,28 @@ class VirtualMachine:
         
         return {"success": True, "result": self.stack[-1] if self.stack else None, "gas_used": self.gas_used}
     
+    def _build_dispatch_table(self, instructions: List[int]) -> Dict[int, Callable[[], Any]]:
+        """
+        Map each opcode to its handler, bound to this execution.
+        
+        Handlers that read operands get the instruction stream bound in, so
+        the interpreter loop dispatches every opcode with one dict lookup
+        and a zero-argument call.
+        
+        Args:
+            instructions: Instructions being executed
+            
+        Returns:
+            Dictionary mapping opcode values to handlers
+        """
+        table = {}
+        for name, opcode in self.OPCODES.items():
+            handler = getattr(self, f"_execute_{name.lower()}")
+            if name in self.OPERAND_OPCODES:
+                handler = functools.partial(handler, instructions)
+            table[opcode] = handler
+        return table
+    
     def _parse_bytecode(self, bytecode: str) -> List[int]:
         """
         Parse bytecode string to list of integers.
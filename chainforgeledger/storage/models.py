@@ -4,19 +4,201 @@ ChainForgeLedger Data Models
 Data models for blockchain entities.
 """
 
-import json
+import operator
+import struct
 import time
-from typing import Dict
+from typing import Dict, Iterator, Union
+from chainforgeledger.utils import fastjson
 from chainforgeledger.utils.logger import get_logger
 
 
-class BlockStorage:
+# Sentinel passed as ``_trusted`` to ``from_dict``/``from_json`` when the data
+# was already validated on ingress (e.g. records read back from local storage).
+TRUSTED = object()
+
+# Fixed-width binary layout of a StateStorage record: 20-byte address,
+# fixed-point balance, nonce, created_at, updated_at.
+STATE_RECORD = struct.Struct('>20sQQdd')
+
+# Fixed-point scale for binary balances (8 decimal places).
+BALANCE_SCALE = 10 ** 8
+
+# Exact value types accepted by StatStorage and contract states accepted by
+# ContractStorage.
+_STAT_TYPES = frozenset((str, int, float, bool))
+_CONTRACT_STATES = frozenset(('deployed', 'deactivated'))
+
+
+class StorageModel:
+    """
+    Base class for storage models.
+    
+    Subclasses declare their persisted attributes in ``FIELDS`` and provide
+    ``__init__`` and ``validate``; serialization and rehydration are shared.
+    """
+    
+    FIELDS = ()
+    
+    def __init_subclass__(cls, **kwargs):
+        """Build the attribute getter used by ``to_dict`` for each model."""
+        super().__init_subclass__(**kwargs)
+        cls._field_getter = operator.attrgetter(*cls.FIELDS) if cls.FIELDS else None
+    
+    def _get_current_timestamp(self) -> float:
+        """Get current timestamp."""
+        return time.time()
+    
+    def to_dict(self) -> Dict:
+        """
+        Convert to dictionary.
+        
+        Returns:
+            Model as dictionary
+        """
+        return dict(zip(self.FIELDS, self._field_getter(self)))
+    
+    def to_json(self) -> str:
+        """
+        Convert to JSON string.
+        
+        Returns:
+            Model as JSON string
+        """
+        return fastjson.dumps(self, indent=True, default=_storage_default)
+    
+    @classmethod
+    def from_dict(cls, data: Dict, _trusted: object = None) -> 'StorageModel':
+        """
+        Create from dictionary.
+        
+        Untrusted callers that need validation should use ``from_dict_validated``.
+        
+        Args:
+            data: Model data
+            _trusted: Pass ``TRUSTED`` to skip constructor defaults for data
+                that was validated on ingress; such data must hold every field
+            
+        Returns:
+            Model instance
+            
+        Raises:
+            ValueError: If trusted data is missing any of the model's fields
+        """
+        if _trusted is TRUSTED:
+            return cls._from_trusted_dict(data)
+        
+        return cls(**data)
+    
+    @classmethod
+    def from_json(cls, json_str: str, _trusted: object = None) -> 'StorageModel':
+        """
+        Create from JSON string.
+        
+        Args:
+            json_str: JSON string
+            _trusted: Pass ``TRUSTED`` for data validated on ingress
+            
+        Returns:
+            Model instance
+        """
+        data = fastjson.loads(json_str)
+        return cls.from_dict(data, _trusted)
+    
+    @classmethod
+    def _from_trusted_dict(cls, data: Dict) -> 'StorageModel':
+        """
+        Rehydrate a model without running the constructor.
+        
+        The data must be a complete record as produced by ``to_dict``;
+        constructor defaults are not applied, so partial records are
+        rejected rather than producing a model with missing attributes.
+        
+        Args:
+            data: Model data
+            
+        Returns:
+            Model instance
+            
+        Raises:
+            ValueError: If the data is missing any of the model's fields
+        """
+        missing = [field for field in cls.FIELDS if field not in data]
+        if missing:
+            raise ValueError(f"Trusted {cls.__name__} data is missing fields: {', '.join(missing)}")
+        
+        instance = cls.__new__(cls)
+        instance.__dict__.update(data)
+        instance.logger = get_logger(__name__)
+        return instance
+    
+    def _to_json_record(self) -> Dict:
+        """
+        Build the record handed to the JSON encoder.
+        
+        Nested models may be left in place; the encoder converts them when
+        it reaches them.
+        """
+        return self.to_dict()
+    
+    @classmethod
+    def from_dict_validated(cls, data: Dict) -> 'StorageModel':
+        """
+        Create from untrusted dictionary and validate the result.
+        
+        Args:
+            data: Model data
+            
+        Returns:
+            Model instance
+            
+        Raises:
+            ValueError: If the data does not form a valid model
+        """
+        instance = cls.from_dict(data)
+        if not instance.validate():
+            raise ValueError(f"Invalid {cls.__name__} data")
+        return instance
+    
+    def __str__(self):
+        """String representation for printing."""
+        return self.to_json()
+
+
+def _storage_default(obj):
+    """
+    JSON encoder callback for storage models.
+    
+    Lets the encoder walk nested models (e.g. a block's transactions) itself,
+    converting each model only when it is reached. Other objects that
+    provide to_dict(), such as core Transactions, are serialized through it.
+    """
+    if isinstance(obj, StorageModel):
+        return obj._to_json_record()
+    if hasattr(obj, 'to_dict'):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class BlockStorage(StorageModel):
     """
     Block storage model.
     
     Represents a blockchain block for storage purposes.
     """
     
+    FIELDS = (
+        'block_index',
+        'previous_hash',
+        'block_hash',
+        'merkle_root',
+        'timestamp',
+        'difficulty',
+        'nonce',
+        'transactions',
+        'miner_address',
+        'hash'
+    )
+    
     def __init__(self, **kwargs):
         """
         Initialize block storage.
@@ -36,10 +218,6 @@ class BlockStorage:
         self.hash = kwargs.get('block_hash', '')
         self.logger = get_logger(__name__)
     
-    def _get_current_timestamp(self) -> float:
-        """Get current timestamp."""
-        return time.time()
-    
     def validate(self) -> bool:
         """
         Validate block structure.
@@ -73,46 +251,53 @@ class BlockStorage:
         
         return True
     
-    def to_dict(self) -> Dict:
+    def _to_json_record(self) -> Dict:
         """
-        Convert to dictionary.
+        Build the record handed to the JSON encoder.
         
-        Returns:
-            Block as dictionary
+        Transactions are passed through as-is so the encoder streams them
+        without an intermediate list of dictionaries.
         """
-        return {
-            'block_index': self.block_index,
-            'previous_hash': self.previous_hash,
-            'block_hash': self.block_hash,
-            'merkle_root': self.merkle_root,
-            'timestamp': self.timestamp,
-            'difficulty': self.difficulty,
-            'nonce': self.nonce,
-            'transactions': [tx.to_dict() if hasattr(tx, 'to_dict') else tx for tx in self.transactions],
-            'miner_address': self.miner_address,
-            'hash': self.hash
-        }
+        return super().to_dict()
     
-    def to_json(self) -> str:
+    def to_dict(self) -> Dict:
         """
-        Convert to JSON string.
+        Convert to dictionary.
         
         Returns:
-            Block as JSON string
+            Block as dictionary
         """
-        return json.dumps(self.to_dict(), indent=2)
+        block_dict = self._to_json_record()
+        block_dict['transactions'] = [
+            tx.to_dict() if hasattr(tx, 'to_dict') else tx for tx in self.transactions
+        ]
+        return block_dict
     
     @classmethod
-    def from_dict(cls, data: Dict) -> 'BlockStorage':
+    def from_dict(cls, data: Dict, _trusted: object = None) -> 'BlockStorage':
         """
         Create from dictionary.
         
+        Untrusted callers that need validation should use ``from_dict_validated``.
+        
         Args:
             data: Block data
+            _trusted: Pass ``TRUSTED`` to skip constructor defaults for data
+                that was validated on ingress; such data must hold every field
             
         Returns:
             BlockStorage instance
+            
+        Raises:
+            ValueError: If trusted data is missing any of the model's fields
         """
+        if _trusted is TRUSTED:
+            block = cls._from_trusted_dict(data)
+            block.transactions = [
+                TransactionStorage.from_dict(tx_data, TRUSTED) for tx_data in data['transactions']
+            ]
+            return block
+        
         block = cls(**data)
         
         # Convert transactions to TransactionStorage objects
@@ -123,36 +308,30 @@ class BlockStorage:
         
         return block
     
-    @classmethod
-    def from_json(cls, json_str: str) -> 'BlockStorage':
-        """
-        Create from JSON string.
-        
-        Args:
-            json_str: JSON string
-            
-        Returns:
-            BlockStorage instance
-        """
-        data = json.loads(json_str)
-        return cls.from_dict(data)
-    
     def __repr__(self):
         """String representation."""
         return f"BlockStorage(index={self.block_index}, hash={self.block_hash[:16]}...)"
-    
-    def __str__(self):
-        """String representation for printing."""
-        return self.to_json()
 
 
-class TransactionStorage:
+class TransactionStorage(StorageModel):
     """
     Transaction storage model.
     
     Represents a blockchain transaction for storage purposes.
     """
     
+    FIELDS = (
+        'transaction_id',
+        'sender',
+        'recipient',
+        'amount',
+        'fee',
+        'timestamp',
+        'data',
+        'signature',
+        'block_index'
+    )
+    
     def __init__(self, **kwargs):
         """
         Initialize transaction storage.
@@ -171,10 +350,6 @@ class TransactionStorage:
         self.block_index = kwargs.get('block_index', None)
         self.logger = get_logger(__name__)
     
-    def _get_current_timestamp(self) -> float:
-        """Get current timestamp."""
-        return time.time()
-    
     def validate(self) -> bool:
         """
         Validate transaction structure.
@@ -208,78 +383,27 @@ class TransactionStorage:
         
         return True
     
-    def to_dict(self) -> Dict:
-        """
-        Convert to dictionary.
-        
-        Returns:
-            Transaction as dictionary
-        """
-        return {
-            'transaction_id': self.transaction_id,
-            'sender': self.sender,
-            'recipient': self.recipient,
-            'amount': self.amount,
-            'fee': self.fee,
-            'timestamp': self.timestamp,
-            'data': self.data,
-            'signature': self.signature,
-            'block_index': self.block_index
-        }
-    
-    def to_json(self) -> str:
-        """
-        Convert to JSON string.
-        
-        Returns:
-            Transaction as JSON string
-        """
-        return json.dumps(self.to_dict(), indent=2)
-    
-    @classmethod
-    def from_dict(cls, data: Dict) -> 'TransactionStorage':
-        """
-        Create from dictionary.
-        
-        Args:
-            data: Transaction data
-            
-        Returns:
-            TransactionStorage instance
-        """
-        return cls(**data)
-    
-    @classmethod
-    def from_json(cls, json_str: str) -> 'TransactionStorage':
-        """
-        Create from JSON string.
-        
-        Args:
-            json_str: JSON string
-            
-        Returns:
-            TransactionStorage instance
-        """
-        data = json.loads(json_str)
-        return cls.from_dict(data)
-    
     def __repr__(self):
         """String representation."""
         return (f"TransactionStorage(id={self.transaction_id[:16]}..., "
                 f"sender={self.sender[:8]}..., recipient={self.recipient[:8]}..., amount={self.amount})")
-    
-    def __str__(self):
-        """String representation for printing."""
-        return self.to_json()
 
 
-class StateStorage:
+class StateStorage(StorageModel):
     """
     State storage model.
     
     Represents the state of an address for storage purposes.
     """
     
+    FIELDS = (
+        'address',
+        'balance',
+        'nonce',
+        'created_at',
+        'updated_at'
+    )
+    
     def __init__(self, **kwargs):
         """
         Initialize state storage.
@@ -294,10 +418,6 @@ class StateStorage:
         self.updated_at = kwargs.get('updated_at', self._get_current_timestamp())
         self.logger = get_logger(__name__)
     
-    def _get_current_timestamp(self) -> float:
-        """Get current timestamp."""
-        return time.time()
-    
     def validate(self) -> bool:
         """
         Validate state structure.
@@ -316,73 +436,93 @@ class StateStorage:
         
         return True
     
-    def to_dict(self) -> Dict:
-        """
-        Convert to dictionary.
-        
-        Returns:
-            State as dictionary
-        """
-        return {
-            'address': self.address,
-            'balance': self.balance,
-            'nonce': self.nonce,
-            'created_at': self.created_at,
-            'updated_at': self.updated_at
-        }
+    @property
+    def balance_int(self) -> int:
+        """Balance as a fixed-point integer in units of 1 / BALANCE_SCALE."""
+        return round(self.balance * BALANCE_SCALE)
     
-    def to_json(self) -> str:
+    def to_bytes(self) -> bytes:
         """
-        Convert to JSON string.
+        Pack state into its fixed-width binary record.
         
         Returns:
-            State as JSON string
+            State as STATE_RECORD bytes
         """
-        return json.dumps(self.to_dict(), indent=2)
+        return STATE_RECORD.pack(
+            bytes.fromhex(self.address),
+            self.balance_int,
+            self.nonce,
+            self.created_at,
+            self.updated_at
+        )
     
     @classmethod
-    def from_dict(cls, data: Dict) -> 'StateStorage':
+    def from_bytes(cls, data: Union[bytes, memoryview]) -> 'StateStorage':
         """
-        Create from dictionary.
+        Create from a binary record produced by ``to_bytes``.
         
         Args:
-            data: State data
+            data: STATE_RECORD bytes
             
         Returns:
             StateStorage instance
         """
-        return cls(**data)
+        return cls._from_record(STATE_RECORD.unpack(data))
     
     @classmethod
-    def from_json(cls, json_str: str) -> 'StateStorage':
+    def iter_from_bytes(cls, data: Union[bytes, memoryview]) -> Iterator['StateStorage']:
         """
-        Create from JSON string.
+        Decode a buffer of concatenated binary records without slicing copies.
         
         Args:
-            json_str: JSON string
+            data: Concatenated STATE_RECORD bytes
             
         Returns:
-            StateStorage instance
+            Iterator of StateStorage instances
         """
-        data = json.loads(json_str)
-        return cls.from_dict(data)
+        for record in STATE_RECORD.iter_unpack(memoryview(data)):
+            yield cls._from_record(record)
+    
+    @classmethod
+    def _from_record(cls, record: tuple) -> 'StateStorage':
+        """Build state from an unpacked STATE_RECORD tuple."""
+        address, balance, nonce, created_at, updated_at = record
+        return cls._from_trusted_dict({
+            'address': address.hex(),
+            'balance': balance / BALANCE_SCALE,
+            'nonce': nonce,
+            'created_at': created_at,
+            'updated_at': updated_at
+        })
     
     def __repr__(self):
         """String representation."""
         return f"StateStorage(address={self.address[:8]}..., balance={self.balance}, nonce={self.nonce})"
-    
-    def __str__(self):
-        """String representation for printing."""
-        return self.to_json()
 
 
-class ContractStorage:
+class ContractStorage(StorageModel):
     """
     Contract storage model.
     
     Represents a smart contract for storage purposes.
     """
     
+    FIELDS = (
+        'contract_address',
+        'source_code',
+        'bytecode',
+        'language',
+        'compiler_options',
+        'deployed_at',
+        'state',
+        'bytecode_hash',
+        'source_code_hash',
+        'updated_at',
+        'deactivated_at',
+        'activated_at',
+        'created_at'
+    )
+    
     def __init__(self, **kwargs):
         """
         Initialize contract storage.
@@ -405,10 +545,6 @@ class ContractStorage:
         self.created_at = kwargs.get('created_at', self._get_current_timestamp())
         self.logger = get_logger(__name__)
     
-    def _get_current_timestamp(self) -> float:
-        """Get current timestamp."""
-        return time.time()
-    
     def validate(self) -> bool:
         """
         Validate contract structure.
@@ -434,7 +570,7 @@ class ContractStorage:
         if not isinstance(self.deployed_at, (int, float)) or self.deployed_at <= 0:
             return False
         
-        if not isinstance(self.state, str) or self.state not in ['deployed', 'deactivated']:
+        if not isinstance(self.state, str) or self.state not in _CONTRACT_STATES:
             return False
         
         if not isinstance(self.bytecode_hash, str) or len(self.bytecode_hash) != 64:
@@ -445,81 +581,26 @@ class ContractStorage:
         
         return True
     
-    def to_dict(self) -> Dict:
-        """
-        Convert to dictionary.
-        
-        Returns:
-            Contract as dictionary
-        """
-        return {
-            'contract_address': self.contract_address,
-            'source_code': self.source_code,
-            'bytecode': self.bytecode,
-            'language': self.language,
-            'compiler_options': self.compiler_options,
-            'deployed_at': self.deployed_at,
-            'state': self.state,
-            'bytecode_hash': self.bytecode_hash,
-            'source_code_hash': self.source_code_hash,
-            'updated_at': self.updated_at,
-            'deactivated_at': self.deactivated_at,
-            'activated_at': self.activated_at,
-            'created_at': self.created_at
-        }
-    
-    def to_json(self) -> str:
-        """
-        Convert to JSON string.
-        
-        Returns:
-            Contract as JSON string
-        """
-        return json.dumps(self.to_dict(), indent=2)
-    
-    @classmethod
-    def from_dict(cls, data: Dict) -> 'ContractStorage':
-        """
-        Create from dictionary.
-        
-        Args:
-            data: Contract data
-            
-        Returns:
-            ContractStorage instance
-        """
-        return cls(**data)
-    
-    @classmethod
-    def from_json(cls, json_str: str) -> 'ContractStorage':
-        """
-        Create from JSON string.
-        
-        Args:
-            json_str: JSON string
-            
-        Returns:
-            ContractStorage instance
-        """
-        data = json.loads(json_str)
-        return cls.from_dict(data)
-    
     def __repr__(self):
         """String representation."""
         return f"ContractStorage(address={self.contract_address[:16]}..., state={self.state})"
-    
-    def __str__(self):
-        """String representation for printing."""
-        return self.to_json()
 
 
-class WalletStorage:
+class WalletStorage(StorageModel):
     """
     Wallet storage model.
     
     Represents a blockchain wallet for storage purposes.
     """
     
+    FIELDS = (
+        'address',
+        'public_key',
+        'private_key',
+        'created_at',
+        'updated_at'
+    )
+    
     def __init__(self, **kwargs):
         """
         Initialize wallet storage.
@@ -534,10 +615,6 @@ class WalletStorage:
         self.updated_at = kwargs.get('updated_at', self._get_current_timestamp())
         self.logger = get_logger(__name__)
     
-    def _get_current_timestamp(self) -> float:
-        """Get current timestamp."""
-        return time.time()
-    
     def validate(self) -> bool:
         """
         Validate wallet structure.
@@ -556,73 +633,28 @@ class WalletStorage:
         
         return True
     
-    def to_dict(self) -> Dict:
-        """
-        Convert to dictionary.
-        
-        Returns:
-            Wallet as dictionary
-        """
-        return {
-            'address': self.address,
-            'public_key': self.public_key,
-            'private_key': self.private_key,
-            'created_at': self.created_at,
-            'updated_at': self.updated_at
-        }
-    
-    def to_json(self) -> str:
-        """
-        Convert to JSON string.
-        
-        Returns:
-            Wallet as JSON string
-        """
-        return json.dumps(self.to_dict(), indent=2)
-    
-    @classmethod
-    def from_dict(cls, data: Dict) -> 'WalletStorage':
-        """
-        Create from dictionary.
-        
-        Args:
-            data: Wallet data
-            
-        Returns:
-            WalletStorage instance
-        """
-        return cls(**data)
-    
-    @classmethod
-    def from_json(cls, json_str: str) -> 'WalletStorage':
-        """
-        Create from JSON string.
-        
-        Args:
-            json_str: JSON string
-            
-        Returns:
-            WalletStorage instance
-        """
-        data = json.loads(json_str)
-        return cls.from_dict(data)
-    
     def __repr__(self):
         """String representation."""
         return f"WalletStorage(address={self.address[:8]}...)"
-    
-    def __str__(self):
-        """String representation for printing."""
-        return self.to_json()
 
 
-class NodeStorage:
+class NodeStorage(StorageModel):
     """
     Node storage model.
     
     Represents a network node for storage purposes.
     """
     
+    FIELDS = (
+        'node_id',
+        'address',
+        'port',
+        'last_seen',
+        'is_connected',
+        'created_at',
+        'updated_at'
+    )
+    
     def __init__(self, **kwargs):
         """
         Initialize node storage.
@@ -639,10 +671,6 @@ class NodeStorage:
         self.updated_at = kwargs.get('updated_at', self._get_current_timestamp())
         self.logger = get_logger(__name__)
     
-    def _get_current_timestamp(self) -> float:
-        """Get current timestamp."""
-        return time.time()
-    
     def validate(self) -> bool:
         """
         Validate node structure.
@@ -667,75 +695,24 @@ class NodeStorage:
         
         return True
     
-    def to_dict(self) -> Dict:
-        """
-        Convert to dictionary.
-        
-        Returns:
-            Node as dictionary
-        """
-        return {
-            'node_id': self.node_id,
-            'address': self.address,
-            'port': self.port,
-            'last_seen': self.last_seen,
-            'is_connected': self.is_connected,
-            'created_at': self.created_at,
-            'updated_at': self.updated_at
-        }
-    
-    def to_json(self) -> str:
-        """
-        Convert to JSON string.
-        
-        Returns:
-            Node as JSON string
-        """
-        return json.dumps(self.to_dict(), indent=2)
-    
-    @classmethod
-    def from_dict(cls, data: Dict) -> 'NodeStorage':
-        """
-        Create from dictionary.
-        
-        Args:
-            data: Node data
-            
-        Returns:
-            NodeStorage instance
-        """
-        return cls(**data)
-    
-    @classmethod
-    def from_json(cls, json_str: str) -> 'NodeStorage':
-        """
-        Create from JSON string.
-        
-        Args:
-            json_str: JSON string
-            
-        Returns:
-            NodeStorage instance
-        """
-        data = json.loads(json_str)
-        return cls.from_dict(data)
-    
     def __repr__(self):
         """String representation."""
         return f"NodeStorage(id={self.node_id[:8]}..., address={self.address}:{self.port})"
-    
-    def __str__(self):
-        """String representation for printing."""
-        return self.to_json()
 
 
-class StatStorage:
+class StatStorage(StorageModel):
     """
     Statistic storage model.
     
     Represents a statistic for storage purposes.
     """
     
+    FIELDS = (
+        'key',
+        'value',
+        'updated_at'
+    )
+    
     def __init__(self, **kwargs):
         """
         Initialize stat storage.
@@ -748,10 +725,6 @@ class StatStorage:
         self.updated_at = kwargs.get('updated_at', self._get_current_timestamp())
         self.logger = get_logger(__name__)
     
-    def _get_current_timestamp(self) -> float:
-        """Get current timestamp."""
-        return time.time()
-    
     def validate(self) -> bool:
         """
         Validate stat structure.
@@ -762,7 +735,7 @@ class StatStorage:
         if not isinstance(self.key, str) or len(self.key) == 0:
             return False
         
-        if not isinstance(self.value, (str, int, float, bool)):
+        if type(self.value) not in _STAT_TYPES:
             return False
         
         if not isinstance(self.updated_at, (int, float)) or self.updated_at <= 0:
@@ -770,59 +743,6 @@ class StatStorage:
         
         return True
     
-    def to_dict(self) -> Dict:
-        """
-        Convert to dictionary.
-        
-        Returns:
-            Stat as dictionary
-        """
-        return {
-            'key': self.key,
-            'value': self.value,
-            'updated_at': self.updated_at
-        }
-    
-    def to_json(self) -> str:
-        """
-        Convert to JSON string.
-        
-        Returns:
-            Stat as JSON string
-        """
-        return json.dumps(self.to_dict(), indent=2)
-    
-    @classmethod
-    def from_dict(cls, data: Dict) -> 'StatStorage':
-        """
-        Create from dictionary.
-        
-        Args:
-            data: Stat data
-            
-        Returns:
-            StatStorage instance
-        """
-        return cls(**data)
-    
-    @classmethod
-    def from_json(cls, json_str: str) -> 'StatStorage':
-        """
-        Create from JSON string.
-        
-        Args:
-            json_str: JSON string
-            
-        Returns:
-            StatStorage instance
-        """
-        data = json.loads(json_str)
-        return cls.from_dict(data)
-    
     def __repr__(self):
         """String representation."""
         return f"StatStorage(key={self.key}, value={self.value})"
-    
-    def __str__(self):
-        """String representation for printing."""
-        return self.to_json()
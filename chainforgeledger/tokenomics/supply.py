@@ -22,8 +22,25 @@ class Tokenomics:
         self.staking_rewards_pool = int(total_supply * 0.10)  # 10% for staking rewards
         self.treasury = int(total_supply * 0.05)  # 5% for treasury
         self.circulating_supply = self.current_supply - self.staking_rewards_pool - self.treasury
+        self._dist_cache = None
+        self._str_cache = None
         self.inflation_rate = 0.02  # 2% annual inflation
     
+    @property
+    def inflation_rate(self) -> float:
+        """Annual inflation rate."""
+        return self._inflation_rate
+    
+    @inflation_rate.setter
+    def inflation_rate(self, value: float):
+        self._inflation_rate = value
+        self._str_cache = None
+    
+    def _invalidate_cache(self):
+        """Drop cached views of the supply after it changes."""
+        self._dist_cache = None
+        self._str_cache = None
+    
     def mint_tokens(self, amount: int, purpose: str = 'general') -> bool:
         """
         Mint new tokens.
@@ -47,7 +64,8 @@ class Tokenomics:
             self.treasury += amount
         else:
             self.circulating_supply += amount
-            
+        
+        self._invalidate_cache()
         return True
     
     def burn_tokens(self, amount: int) -> bool:
@@ -73,23 +91,29 @@ class Tokenomics:
             remaining = amount - self.circulating_supply
             self.circulating_supply = 0
             self.staking_rewards_pool -= remaining
-            
+        
+        self._invalidate_cache()
         return True
     
     def get_supply_distribution(self) -> Dict[str, int]:
         """
         Get token supply distribution.
         
+        The values are cached until the next mint or burn; each call returns
+        a fresh copy that callers may modify.
+        
         Returns:
             Dictionary with supply distribution details
         """
-        return {
-            'total': self.total_supply,
-            'current': self.current_supply,
-            'circulating': self.circulating_supply,
-            'staking_rewards': self.staking_rewards_pool,
-            'treasury': self.treasury
-        }
+        if self._dist_cache is None:
+            self._dist_cache = {
+                'total': self.total_supply,
+                'current': self.current_supply,
+                'circulating': self.circulating_supply,
+                'staking_rewards': self.staking_rewards_pool,
+                'treasury': self.treasury
+            }
+        return dict(self._dist_cache)
     
     def calculate_inflation(self, years: int = 1) -> int:
         """
@@ -121,8 +145,11 @@ class Tokenomics:
         return f"Tokenomics(total_supply={self.total_supply:,})"
     
     def __str__(self):
+        if self._str_cache is not None:
+            return self._str_cache
+        
         info = self.get_tokenomics_info()
-        return (
+        self._str_cache = (
             f"Tokenomics:\n"
             f"  Total Supply: {info['supply']['total']:,}\n"
             f"  Current Supply: {info['supply']['current']:,}\n"
@@ -132,3 +159,4 @@ class Tokenomics:
             f"  Inflation Rate: {info['inflation_rate']:.1%}\n"
             f"  Next Year Inflation: {info['next_year_inflation']:,}"
         )
+        return self._str_cache
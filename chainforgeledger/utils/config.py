@@ -5,9 +5,105 @@ Configuration management for blockchain operations.
 """
 
 import configparser
-import json
+import copy
+import functools
+import logging
+import mmap
 import os
-from typing import Any, Dict
+import pathlib
+from collections import OrderedDict, defaultdict
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Tuple
+from chainforgeledger.utils import fastjson
+
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
+
+logger = logging.getLogger(__name__)
+
+# JSON Schema equivalent of the checks in Config.validate
+CONFIG_SCHEMA = {
+    "type": "object",
+    "required": ["network", "blockchain", "consensus"],
+    "properties": {
+        "network": {
+            "type": "object",
+            "required": ["host", "port"],
+            "properties": {
+                "host": {"not": {"enum": ["", None]}},
+                "port": {"type": "integer", "exclusiveMinimum": 0, "exclusiveMaximum": 65536}
+            }
+        },
+        "blockchain": {
+            "type": "object",
+            "required": ["name", "block_time"],
+            "properties": {
+                "name": {"not": {"enum": ["", None]}},
+                "block_time": {"type": "number", "exclusiveMinimum": 0}
+            }
+        },
+        "consensus": {
+            "type": "object",
+            "required": ["algorithm"],
+            "properties": {
+                "algorithm": {"enum": ["pow", "pos", "poa"]}
+            }
+        },
+        "security": {
+            "type": ["object", "null"],
+            "properties": {
+                "mining_reward": {"type": ["number", "null"], "minimum": 0}
+            }
+        }
+    }
+}
+
+_schema_validator = fastjsonschema.compile(CONFIG_SCHEMA) if fastjsonschema is not None else None
+
+
+def _is_number(value: Any, types: Tuple[type, ...] = (int, float)) -> bool:
+    """Check a value the way CONFIG_SCHEMA types it, where bool is not a number"""
+    return isinstance(value, types) and not isinstance(value, bool)
+
+# Parsed configuration files keyed by (absolute path, mtime_ns, size), least
+# recently used first
+_PARSE_CACHE: "OrderedDict[Tuple[str, int, int], Dict]" = OrderedDict()
+_PARSE_CACHE_SIZE = 32
+
+
+def _cached_parse(config_path: str, parser: Callable[[str], Dict]) -> Dict:
+    """
+    Parse a configuration file, reusing the result while the file is unchanged.
+    
+    Args:
+        config_path: Path to configuration file
+        parser: Function parsing the file into a dictionary
+        
+    Returns:
+        Deep copy of the parsed configuration
+    """
+    stat = os.stat(config_path)
+    key = (os.path.abspath(config_path), stat.st_mtime_ns, stat.st_size)
+    
+    config = _PARSE_CACHE.get(key)
+    if config is None:
+        config = parser(config_path)
+        _PARSE_CACHE[key] = config
+        if len(_PARSE_CACHE) > _PARSE_CACHE_SIZE:
+            _PARSE_CACHE.popitem(last=False)
+    else:
+        _PARSE_CACHE.move_to_end(key)
+    
+    return copy.deepcopy(config)
+
+
+@functools.lru_cache(maxsize=256)
+def _split_key(key: str) -> Tuple[str, ...]:
+    """Split a dotted configuration key into its path parts."""
+    return tuple(key.split('.'))
 
 
 class Config:
@@ -72,6 +168,32 @@ class Config:
         }
     }
     
+    # Configuration file handlers by file extension
+    _LOADERS = {
+        '.json': '_load_json',
+        '.ini': '_load_ini', '.cfg': '_load_ini', '.config': '_load_ini',
+        '.yaml': '_load_yaml', '.yml': '_load_yaml'
+    }
+    _SAVERS = {
+        '.json': '_save_json',
+        '.ini': '_save_ini', '.cfg': '_save_ini', '.config': '_save_ini',
+        '.yaml': '_save_yaml', '.yml': '_save_yaml'
+    }
+    
+    # Pre-split paths of keys read by validate
+    _K_NETWORK_HOST = ('network', 'host')
+    _K_NETWORK_PORT = ('network', 'port')
+    _K_BLOCKCHAIN_NAME = ('blockchain', 'name')
+    _K_BLOCKCHAIN_BLOCK_TIME = ('blockchain', 'block_time')
+    _K_CONSENSUS_ALGORITHM = ('consensus', 'algorithm')
+    _K_SECURITY_MINING_REWARD = ('security', 'mining_reward')
+    
+    # Environment variable spellings of boolean values
+    _ENV_BOOLEANS = {
+        'true': True, 'yes': True, 'on': True,
+        'false': False, 'no': False, 'off': False
+    }
+    
     def __init__(self, config_path: str = None):
         """
         Initialize configuration.
@@ -80,11 +202,62 @@ class Config:
             config_path: Path to configuration file
         """
         self.config_path = config_path
-        self.config = self.DEFAULT_CONFIG.copy()
+        self.config = self._copy_defaults()
         
         if config_path:
             self.load(config_path)
     
+    def __init_subclass__(cls, **kwargs):
+        """Freeze the defaults of subclasses that override DEFAULT_CONFIG."""
+        super().__init_subclass__(**kwargs)
+        if 'DEFAULT_CONFIG' in cls.__dict__:
+            cls._prepare_defaults()
+    
+    @classmethod
+    def _prepare_defaults(cls):
+        """
+        Freeze DEFAULT_CONFIG and pre-serialize it for fast copies.
+        
+        DEFAULT_CONFIG becomes a read-only mapping of read-only sections
+        (lists become tuples). When orjson is available the defaults are
+        also kept as a JSON blob, since parsing it is faster than copying
+        the dictionaries.
+        """
+        defaults = {
+            section: {
+                key: list(value) if isinstance(value, tuple) else value
+                for key, value in settings.items()
+            }
+            for section, settings in cls.DEFAULT_CONFIG.items()
+        }
+        cls._DEFAULT_BLOB = fastjson.dumps_bytes(defaults) if fastjson.HAVE_ORJSON else None
+        cls.DEFAULT_CONFIG = MappingProxyType({
+            section: MappingProxyType({
+                key: tuple(value) if isinstance(value, list) else value
+                for key, value in settings.items()
+            })
+            for section, settings in defaults.items()
+        })
+    
+    def _copy_defaults(self) -> Dict:
+        """
+        Copy the default configuration for this instance.
+        
+        Returns:
+            Independent, mutable copy of the default configuration
+        """
+        if self._DEFAULT_BLOB is not None:
+            return fastjson.loads(self._DEFAULT_BLOB)
+        
+        return {
+            section: {
+                key: list(value) if isinstance(value, tuple) else
+                     dict(value) if isinstance(value, dict) else value
+                for key, value in settings.items()
+            }
+            for section, settings in self.DEFAULT_CONFIG.items()
+        }
+    
     def load(self, config_path: str = None) -> bool:
         """
         Load configuration from file.
@@ -99,35 +272,47 @@ class Config:
             if not config_path:
                 config_path = self.config_path
             
-            if not config_path or not os.path.exists(config_path):
+            if not config_path:
                 return False
             
-            config_ext = os.path.splitext(config_path)[1].lower()
-            
-            if config_ext == '.json':
-                self._load_json(config_path)
-            elif config_ext in ('.ini', '.cfg', '.config'):
-                self._load_ini(config_path)
-            elif config_ext == '.yaml' or config_ext == '.yml':
-                self._load_yaml(config_path)
-            else:
+            config_ext = pathlib.Path(config_path).suffix.lower()
+            loader = self._LOADERS.get(config_ext)
+            if loader is None:
                 raise ValueError(f"Unsupported configuration format: {config_ext}")
             
+            # The loaders stat the file once; a missing file is not an error
+            getattr(self, loader)(config_path)
             return True
             
-        except Exception as e:
-            print(f"Failed to load configuration: {e}")
+        except FileNotFoundError:
+            return False
+        except Exception:
+            logger.exception("Failed to load configuration from %s", config_path)
             return False
     
     def _load_json(self, config_path: str):
         """Load JSON configuration file."""
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config = json.load(f)
-        
-        self._merge_config(config)
+        self._merge_config(_cached_parse(config_path, self._parse_json))
     
     def _load_ini(self, config_path: str):
         """Load INI configuration file."""
+        self._merge_config(_cached_parse(config_path, self._parse_ini))
+    
+    def _load_yaml(self, config_path: str):
+        """Load YAML configuration file."""
+        self._merge_config(_cached_parse(config_path, self._parse_yaml))
+    
+    @staticmethod
+    def _parse_json(config_path: str) -> Dict:
+        """Parse JSON configuration file straight from a read-only memory map."""
+        with open(config_path, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                with memoryview(mapped) as view:
+                    return fastjson.loads(view)
+    
+    @staticmethod
+    def _parse_ini(config_path: str) -> Dict:
+        """Parse INI configuration file."""
         config = configparser.ConfigParser()
         config.read(config_path)
         
@@ -135,19 +320,19 @@ class Config:
         for section in config.sections():
             config_dict[section] = dict(config[section])
         
-        self._merge_config(config_dict)
+        return config_dict
     
-    def _load_yaml(self, config_path: str):
-        """Load YAML configuration file."""
+    @staticmethod
+    def _parse_yaml(config_path: str) -> Dict:
+        """Parse YAML configuration file."""
         try:
             import yaml
+            loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
             with open(config_path, 'r', encoding='utf-8') as f:
-                config = yaml.safe_load(f)
-            
-            self._merge_config(config)
+                return yaml.load(f, Loader=loader)
         
         except ImportError:
-            print("PyYAML module not installed, cannot load YAML configuration")
+            logger.error("PyYAML module not installed, cannot load YAML configuration")
             raise
     
     def _merge_config(self, config: Dict):
@@ -172,29 +357,22 @@ class Config:
             if not config_path:
                 raise ValueError("No configuration path specified")
             
-            config_dir = os.path.dirname(config_path)
-            if config_dir and not os.path.exists(config_dir):
-                os.makedirs(config_dir, exist_ok=True)
-            
-            config_ext = os.path.splitext(config_path)[1].lower()
+            path = pathlib.Path(config_path)
+            saver = self._SAVERS.get(path.suffix.lower())
+            if saver is None:
+                raise ValueError(f"Unsupported configuration format: {path.suffix.lower()}")
             
-            if config_ext == '.json':
-                self._save_json(config_path)
-            elif config_ext in ('.ini', '.cfg', '.config'):
-                self._save_ini(config_path)
-            elif config_ext == '.yaml' or config_ext == '.yml':
-                self._save_yaml(config_path)
-            else:
-                raise ValueError(f"Unsupported configuration format: {config_ext}")
+            path.parent.mkdir(parents=True, exist_ok=True)
+            getattr(self, saver)(config_path)
             
-        except Exception as e:
-            print(f"Failed to save configuration: {e}")
+        except Exception:
+            logger.exception("Failed to save configuration to %s", config_path)
             raise
     
     def _save_json(self, config_path: str):
         """Save configuration as JSON file."""
-        with open(config_path, 'w', encoding='utf-8') as f:
-            json.dump(self.config, f, indent=2)
+        with open(config_path, 'wb') as f:
+            f.write(fastjson.dumps_bytes(self.config, indent=True))
     
     def _save_ini(self, config_path: str):
         """Save configuration as INI file."""
@@ -212,11 +390,12 @@ class Config:
         """Save configuration as YAML file."""
         try:
             import yaml
+            dumper = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
             with open(config_path, 'w', encoding='utf-8') as f:
-                yaml.dump(self.config, f, default_flow_style=False)
+                yaml.dump(self.config, f, Dumper=dumper, default_flow_style=False)
         
         except ImportError:
-            print("PyYAML module not installed, cannot save YAML configuration")
+            logger.error("PyYAML module not installed, cannot save YAML configuration")
             raise
     
     def get(self, key: str, default: Any = None) -> Any:
@@ -230,19 +409,29 @@ class Config:
         Returns:
             Configuration value
         """
-        try:
-            value = self.config
-            
-            for part in key.split('.'):
-                value = value.get(part)
-                if value is None:
-                    return default
-            
-            return value
+        return self._get_path(_split_key(key), default)
+    
+    def _get_path(self, parts: Tuple[str, ...], default: Any = None) -> Any:
+        """
+        Get configuration value from an already split key path.
+        
+        Args:
+            parts: Key path, e.g. ('network', 'port')
+            default: Default value if key not found
             
-        except Exception as e:
-            print(f"Failed to get configuration value: {e}")
-            return default
+        Returns:
+            Configuration value
+        """
+        value = self.config
+        
+        for part in parts:
+            if not isinstance(value, dict):
+                return default
+            value = value.get(part)
+            if value is None:
+                return default
+        
+        return value
     
     def set(self, key: str, value: Any):
         """
@@ -255,7 +444,7 @@ class Config:
         try:
             config = self.config
             
-            parts = key.split('.')
+            parts = _split_key(key)
             for part in parts[:-1]:
                 if part not in config:
                     config[part] = {}
@@ -264,8 +453,8 @@ class Config:
             config[parts[-1]] = value
             self.config_changed()
             
-        except Exception as e:
-            print(f"Failed to set configuration value: {e}")
+        except Exception:
+            logger.exception("Failed to set configuration value %s", key)
             raise
     
     def has(self, key: str) -> bool:
@@ -278,18 +467,16 @@ class Config:
         Returns:
             True if key exists, False otherwise
         """
-        try:
-            value = self.config
-            
-            for part in key.split('.'):
-                value = value.get(part)
-                if value is None:
-                    return False
-            
-            return True
-            
-        except Exception as e:
-            return False
+        value = self.config
+        
+        for part in _split_key(key):
+            if not isinstance(value, dict):
+                return False
+            value = value.get(part)
+            if value is None:
+                return False
+        
+        return True
     
     def get_section(self, section: str) -> Dict:
         """
@@ -321,39 +508,49 @@ class Config:
         Returns:
             True if configuration is valid, False otherwise
         """
+        if _schema_validator is not None:
+            try:
+                _schema_validator(self.config)
+                return True
+            except fastjsonschema.JsonSchemaException:
+                return False
+        
         try:
-            # Validate network settings
-            if self.get('network.host', '') == '':
+            # Validate consensus settings
+            if self._get_path(self._K_CONSENSUS_ALGORITHM) not in ('pow', 'pos', 'poa'):
                 return False
             
-            if not isinstance(self.get('network.port', 0), int) or not (0 < self.get('network.port') < 65536):
+            # Validate network settings
+            if self._get_path(self._K_NETWORK_HOST, '') == '':
                 return False
             
-            # Validate blockchain settings
-            if self.get('blockchain.name', '') == '':
+            # bool is an int subclass but not a JSON Schema integer or number
+            port = self._get_path(self._K_NETWORK_PORT, 0)
+            if not _is_number(port, int) or not (0 < port < 65536):
                 return False
             
-            if not isinstance(self.get('blockchain.block_time', 0), (int, float)) or self.get('blockchain.block_time') <= 0:
+            # Validate blockchain settings
+            if self._get_path(self._K_BLOCKCHAIN_NAME, '') == '':
                 return False
             
-            # Validate consensus settings
-            valid_algorithms = ['pow', 'pos', 'poa']
-            if self.get('consensus.algorithm') not in valid_algorithms:
+            block_time = self._get_path(self._K_BLOCKCHAIN_BLOCK_TIME, 0)
+            if not _is_number(block_time) or block_time <= 0:
                 return False
             
             # Validate security settings
-            if not isinstance(self.get('security.mining_reward', 0), (int, float)) or self.get('security.mining_reward') < 0:
+            mining_reward = self._get_path(self._K_SECURITY_MINING_REWARD, 0)
+            if not _is_number(mining_reward) or mining_reward < 0:
                 return False
             
             return True
             
-        except Exception as e:
-            print(f"Configuration validation failed: {e}")
+        except Exception:
+            logger.debug("Configuration validation failed", exc_info=True)
             return False
     
     def reset(self):
         """Reset configuration to default values."""
-        self.config = self.DEFAULT_CONFIG.copy()
+        self.config = self._copy_defaults()
         self.config_changed()
     
     def config_changed(self):
@@ -365,28 +562,50 @@ class Config:
     
     def to_json(self) -> str:
         """Convert to JSON string."""
-        return json.dumps(self.config, indent=2)
+        return fastjson.dumps(self.config, indent=True)
     
     def load_env_variables(self, prefix: str = 'CHAINFORGEL'):
         """
         Load configuration from environment variables.
         
+        ``<PREFIX>_<SECTION>_<KEY>`` sets ``KEY`` inside an existing section
+        (e.g. ``CHAINFORGEL_NETWORK_PORT`` sets ``network.port``); other
+        variables set a top-level key. Updates are grouped per section and
+        merged in one pass.
+        
         Args:
             prefix: Environment variable prefix
         """
         prefix = prefix.upper()
+        key_start = len(prefix) + 1
+        
+        section_updates = defaultdict(dict)
+        top_level_updates = {}
         
         for key, value in os.environ.items():
-            if key.startswith(prefix):
-                config_key = key[len(prefix) + 1:].lower()
-                self.set(config_key, self._parse_env_value(value))
+            if not key.startswith(prefix):
+                continue
+            
+            config_key = key[key_start:].lower()
+            section, _, field = config_key.partition('_')
+            if field and isinstance(self.config.get(section), dict):
+                section_updates[section][field] = self._parse_env_value(value)
+            else:
+                top_level_updates[config_key] = self._parse_env_value(value)
+        
+        if not section_updates and not top_level_updates:
+            return
+        
+        for section, settings in section_updates.items():
+            self.config[section].update(settings)
+        self.config.update(top_level_updates)
+        self.config_changed()
     
     def _parse_env_value(self, value: str):
         """Parse environment variable value to appropriate type."""
-        if value.lower() in ['true', 'yes', 'on']:
-            return True
-        if value.lower() in ['false', 'no', 'off']:
-            return False
+        lowered = value.lower()
+        if lowered in self._ENV_BOOLEANS:
+            return self._ENV_BOOLEANS[lowered]
         
         try:
             return int(value)
@@ -396,9 +615,7 @@ class Config:
         try:
             return float(value)
         except ValueError:
-            pass
-        
-        return value
+            return value
     
     def __getitem__(self, key: str):
         """Get configuration value using dictionary syntax."""
@@ -446,7 +663,12 @@ class Config:
         Returns:
             Config instance
         """
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(fastjson.loads(json_str))
+    
+    @classmethod
+    def clear_cache(cls):
+        """Discard all cached parsed configuration files."""
+        _PARSE_CACHE.clear()
     
     @classmethod
     def create_default_config(cls, config_path: str) -> 'Config':
@@ -462,3 +684,6 @@ class Config:
         config = cls(config_path)
         config.save(config_path)
         return config
+
+
+Config._prepare_defaults()
@@ -5,15 +5,52 @@ Cryptographic utilities for blockchain operations.
 """
 
 import binascii
+import hashlib
+import hmac
 import os
+import secrets
 from typing import Any, Tuple
 from chainforgeledger.crypto.hashing import (
+    n as _curve_order,
     sha256_hash,
     generate_keys as ecdsa_generate_keys,
     sign as ecdsa_sign,
     verify as ecdsa_verify
 )
 
+try:
+    import coincurve
+    from coincurve.ecdsa import cdata_to_der, der_to_cdata, deserialize_compact, serialize_compact
+except ImportError:
+    coincurve = None
+
+
+HAVE_SECP256K1 = coincurve is not None
+
+# Plain int: the curve order may be a gmpy2 mpz, which lacks to_bytes before gmpy2 2.2
+CURVE_ORDER = int(_curve_order)
+
+
+def _xor_with_key(data: bytes, key: bytes) -> bytes:
+    """
+    XOR data with a repeating key.
+    
+    The key is tiled to the data length and both are XORed as single big
+    integers, so the work happens in C rather than once per byte.
+    
+    Args:
+        data: Data bytes
+        key: Key bytes
+        
+    Returns:
+        XORed bytes of the same length as data
+    """
+    length = len(data)
+    repeats, remainder = divmod(length, len(key))
+    tiled_key = key * repeats + key[:remainder]
+    value = int.from_bytes(data, 'big') ^ int.from_bytes(tiled_key, 'big')
+    return value.to_bytes(length, 'big')
+
 
 class CryptoUtils:
     """
@@ -23,10 +60,22 @@ class CryptoUtils:
     and encryption for blockchain applications.
     """
     
+    @staticmethod
+    def _to_bytes(data: Any) -> bytes:
+        """Encode data for hashing; non-string values are hashed by their str()."""
+        if isinstance(data, bytes):
+            return data
+        if not isinstance(data, str):
+            data = str(data)
+        return data.encode('utf-8')
+    
     @staticmethod
     def sha256(data: Any) -> str:
         """
-        Compute SHA-256 hash of data using self-made implementation.
+        Compute SHA-256 hash of data.
+        
+        Uses hashlib, whose OpenSSL backend uses the CPU's SHA extensions
+        where available. Output matches the self-made ``sha256_hash``.
         
         Args:
             data: Data to hash
@@ -34,72 +83,47 @@ class CryptoUtils:
         Returns:
             SHA-256 hash as hexadecimal string
         """
-        if isinstance(data, str):
-            pass  # Already string, use directly
-        elif isinstance(data, bytes):
-            data = data.decode('utf-8')
-        else:
-            data = str(data)
-            
-        return sha256_hash(data)
+        return hashlib.sha256(CryptoUtils._to_bytes(data)).hexdigest()
     
     @staticmethod
     def sha512(data: Any) -> str:
         """
-        Compute SHA-512 hash of data (placeholder - using SHA-256 for consistency).
+        Compute SHA-512 hash of data.
         
         Args:
             data: Data to hash
             
         Returns:
-            SHA-512 hash as hexadecimal string (using SHA-256 for now)
+            SHA-512 hash as hexadecimal string
         """
-        # Note: SHA-512 implementation not available, using SHA-256 for consistency
-        if isinstance(data, str):
-            pass  # Already string, use directly
-        elif isinstance(data, bytes):
-            data = data.decode('utf-8')
-        else:
-            data = str(data)
-            
-        return sha256_hash(data)
+        return hashlib.sha512(CryptoUtils._to_bytes(data)).hexdigest()
     
     @staticmethod
     def md5(data: Any) -> str:
         """
-        Compute MD5 hash of data (placeholder - using SHA-256 for consistency).
+        Compute MD5 hash of data.
         
         Args:
             data: Data to hash
             
         Returns:
-            MD5 hash as hexadecimal string (using SHA-256 for now)
+            MD5 hash as hexadecimal string
         """
-        # Note: MD5 implementation not available, using SHA-256 for consistency
-        if isinstance(data, str):
-            pass  # Already string, use directly
-        elif isinstance(data, bytes):
-            data = data.decode('utf-8')
-        else:
-            data = str(data)
-            
-        return sha256_hash(data)
+        return hashlib.md5(CryptoUtils._to_bytes(data)).hexdigest()
     
     @staticmethod
     def hmac_sha256(key: str, message: str) -> str:
         """
-        Compute HMAC-SHA256 (placeholder implementation).
+        Compute HMAC-SHA256.
         
         Args:
             key: Secret key
             message: Message to authenticate
             
         Returns:
-            HMAC-SHA256 as hexadecimal string (simple implementation)
+            HMAC-SHA256 as hexadecimal string
         """
-        # Simple HMAC implementation using SHA-256 (not cryptographically secure for production)
-        combined = key + message
-        return sha256_hash(combined)
+        return hmac.new(key.encode('utf-8'), message.encode('utf-8'), hashlib.sha256).hexdigest()
     
     @staticmethod
     def generate_rsa_keys(bits: int = 2048) -> Tuple[str, str]:
@@ -113,9 +137,9 @@ class CryptoUtils:
             Tuple containing private key and public key (simple string format)
         """
         # For demonstration purposes - in real scenario, implement RSA key generation
-        import random
-        private_key = hex(random.randint(10**100, 10**200))
-        public_key = hex(random.randint(10**100, 10**200))
+        key_bytes = bits // 8
+        private_key = hex(int.from_bytes(secrets.token_bytes(key_bytes), 'big'))
+        public_key = hex(int.from_bytes(secrets.token_bytes(key_bytes), 'big'))
         return private_key, public_key
     
     @staticmethod
@@ -131,9 +155,7 @@ class CryptoUtils:
         """
         private_key, public_key = ecdsa_generate_keys()
         # Convert to hex format for storage/transmission
-        private_hex = hex(private_key)
-        public_hex = f"04{hex(public_key[0])[2:].zfill(64)}{hex(public_key[1])[2:].zfill(64)}"
-        return private_hex, public_hex
+        return private_key_to_hex(private_key), public_key_to_hex(public_key)
     
     @staticmethod
     def rsa_sign(private_key_pem: str, message: str) -> str:
@@ -169,58 +191,84 @@ class CryptoUtils:
         return signature_b64 == expected_signature
     
     @staticmethod
-    def ec_sign(private_key_pem: str, message: str, curve: str = 'secp256k1') -> str:
+    def ec_sign(private_key_pem: str, message: str, curve: str = 'secp256k1',
+                use_pure: bool = False) -> str:
         """
-        Sign message using elliptic curve cryptography with self-made ECDSA.
+        Sign message using elliptic curve cryptography.
+        
+        Uses libsecp256k1 through coincurve when it is installed, otherwise
+        the self-made ECDSA implementation. Both produce signatures over the
+        SHA-256 digest of the message in the same r || s format.
         
         Args:
             private_key_pem: Private key in hex format
             message: Message to sign
             curve: Elliptic curve name
+            use_pure: Force the self-made implementation
             
         Returns:
-            Signature as base64 encoded string
+            Signature as hex string (64-byte r + 64-byte s)
         """
         try:
             # Convert private key from hex to integer
-            private_key = int(private_key_pem.strip('0x'), 16)
+            private_key = hex_to_private_key(private_key_pem)
+            
+            if coincurve is not None and not use_pure:
+                der_signature = coincurve.PrivateKey(private_key.to_bytes(32, 'big')).sign(
+                    message.encode('utf-8')
+                )
+                return serialize_compact(der_to_cdata(der_signature)).hex()
+            
             # Sign message
             r, s = ecdsa_sign(message, private_key)
             # Combine r and s into signature string
-            signature = f"{hex(r)[2:].zfill(64)}{hex(s)[2:].zfill(64)}"
-            return signature
+            return r.to_bytes(32, 'big').hex() + s.to_bytes(32, 'big').hex()
         except Exception as e:
             raise Exception(f"EC signature failed: {e}")
     
     @staticmethod
-    def ec_verify(public_key_pem: str, message: str, signature_b64: str, curve: str = 'secp256k1') -> bool:
+    def ec_verify(public_key_pem: str, message: str, signature_b64: str, curve: str = 'secp256k1',
+                  use_pure: bool = False) -> bool:
         """
-        Verify elliptic curve signature using self-made ECDSA.
+        Verify elliptic curve signature.
+        
+        Uses libsecp256k1 through coincurve when it is installed, otherwise
+        the self-made ECDSA implementation.
         
         Args:
             public_key_pem: Public key in hex format (04 prefix)
             message: Message to verify
             signature_b64: Signature as hex string (64-byte r + 64-byte s)
             curve: Elliptic curve name
+            use_pure: Force the self-made implementation
             
         Returns:
             True if signature is valid, False otherwise
         """
         try:
             # Parse public key
-            if public_key_pem.startswith('04'):
-                public_key_pem = public_key_pem[2:]
-            x = int(public_key_pem[:64], 16)
-            y = int(public_key_pem[64:], 16)
-            public_key = (x, y)
+            public_key = hex_to_public_key(public_key_pem)
             
             # Parse signature
-            r = int(signature_b64[:64], 16)
-            s = int(signature_b64[64:], 16)
-            signature = (r, s)
+            raw_signature = bytes.fromhex(signature_b64)
+            r = int.from_bytes(raw_signature[:32], 'big')
+            s = int.from_bytes(raw_signature[32:], 'big')
+            
+            if coincurve is not None and not use_pure:
+                if not (1 <= r < CURVE_ORDER and 1 <= s < CURVE_ORDER):
+                    return False
+                # libsecp256k1 only accepts low-s signatures; (r, s) and
+                # (r, n - s) verify identically
+                if s > CURVE_ORDER // 2:
+                    s = CURVE_ORDER - s
+                compact = r.to_bytes(32, 'big') + s.to_bytes(32, 'big')
+                point = b'\x04' + public_key[0].to_bytes(32, 'big') + public_key[1].to_bytes(32, 'big')
+                return coincurve.PublicKey(point).verify(
+                    cdata_to_der(deserialize_compact(compact)), message.encode('utf-8')
+                )
             
             # Verify signature
-            return ecdsa_verify(message, signature, public_key)
+            return ecdsa_verify(message, (r, s), public_key)
         except Exception as e:
             raise Exception(f"EC verification failed: {e}")
     
@@ -240,15 +288,7 @@ class CryptoUtils:
         """
         try:
             # XOR encryption (simple self-made approach)
-            key_bytes = key.encode('utf-8')
-            data_bytes = data.encode('utf-8')
-            
-            encrypted_bytes = bytearray()
-            key_len = len(key_bytes)
-            
-            for i, byte in enumerate(data_bytes):
-                encrypted_bytes.append(byte ^ key_bytes[i % key_len])
-                
+            encrypted_bytes = _xor_with_key(data.encode('utf-8'), key.encode('utf-8'))
             return binascii.hexlify(encrypted_bytes).decode('utf-8')
                 
         except Exception as e:
@@ -269,16 +309,8 @@ class CryptoUtils:
         """
         try:
             # XOR decryption (simple self-made approach)
-            key_bytes = key.encode('utf-8')
             encrypted_bytes = binascii.unhexlify(encrypted_data)
-            
-            decrypted_bytes = bytearray()
-            key_len = len(key_bytes)
-            
-            for i, byte in enumerate(encrypted_bytes):
-                decrypted_bytes.append(byte ^ key_bytes[i % key_len])
-                
-            return decrypted_bytes.decode('utf-8')
+            return _xor_with_key(encrypted_bytes, key.encode('utf-8')).decode('utf-8')
                 
         except Exception as e:
             raise Exception(f"Decryption failed: {e}")
@@ -312,23 +344,20 @@ class CryptoUtils:
     @staticmethod
     def pbkdf2(password: str, salt: str, iterations: int = 100000, key_length: int = 32) -> str:
         """
-        Simple key derivation function as a placeholder for PBKDF2.
+        Derive a key with PBKDF2-HMAC-SHA256.
         
         Args:
             password: Password
             salt: Salt value
             iterations: Number of iterations
-            key_length: Length of derived key
+            key_length: Length of derived key in bytes
             
         Returns:
             Derived key as hexadecimal string
         """
-        # Simple key derivation using repeated hashing
-        key = password + salt
-        for i in range(iterations):
-            key = CryptoUtils.sha256(key)
-        
-        return key[:key_length*2]  # Each hex character is 4 bits
+        return hashlib.pbkdf2_hmac(
+            'sha256', password.encode('utf-8'), salt.encode('utf-8'), iterations, key_length
+        ).hex()
 
 
 # ==========================================
@@ -341,16 +370,15 @@ def private_key_to_hex(private_key: int) -> str:
 
 def public_key_to_hex(public_key: Tuple[int, int]) -> str:
     """Convert public key (x, y) coordinates to hexadecimal string with 04 prefix."""
-    return f"04{hex(public_key[0])[2:].zfill(64)}{hex(public_key[1])[2:].zfill(64)}"
+    return "04" + public_key[0].to_bytes(32, 'big').hex() + public_key[1].to_bytes(32, 'big').hex()
 
 def hex_to_private_key(private_key_hex: str) -> int:
-    """Convert hexadecimal private key string to integer."""
-    return int(private_key_hex.strip('0x'), 16)
+    """Convert hexadecimal private key string (with or without 0x prefix) to integer."""
+    return int(private_key_hex, 16)
 
 def hex_to_public_key(public_key_hex: str) -> Tuple[int, int]:
     """Convert hexadecimal public key string to (x, y) coordinates."""
     if public_key_hex.startswith('04'):
         public_key_hex = public_key_hex[2:]
-    x = int(public_key_hex[:64], 16)
-    y = int(public_key_hex[64:], 16)
-    return (x, y)
+    raw = bytes.fromhex(public_key_hex)
+    return (int.from_bytes(raw[:32], 'big'), int.from_bytes(raw[32:], 'big'))
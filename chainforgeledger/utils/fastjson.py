@@ -0,0 +1,72 @@
+"""
+ChainForgeLedger Fast JSON Module
+
+JSON encoding helpers backed by orjson when it is installed, falling back
+to the standard library json module otherwise.
+"""
+
+import json
+from typing import Any, Callable
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+HAVE_ORJSON = orjson is not None
+
+
+def dumps_bytes(obj: Any, indent: bool = False, default: Callable = None) -> bytes:
+    """
+    Serialize an object to UTF-8 encoded JSON bytes.
+
+    Args:
+        obj: Object to serialize
+        indent: Pretty-print with two-space indentation
+        default: Callback returning a serializable value for unknown objects
+
+    Returns:
+        JSON document as bytes
+    """
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(obj, default=default, option=option)
+
+    return json.dumps(obj, indent=2 if indent else None, default=default).encode('utf-8')
+
+
+def dumps(obj: Any, indent: bool = False, default: Callable = None) -> str:
+    """
+    Serialize an object to a JSON string.
+
+    Args:
+        obj: Object to serialize
+        indent: Pretty-print with two-space indentation
+        default: Callback returning a serializable value for unknown objects
+
+    Returns:
+        JSON document as string
+    """
+    if orjson is not None:
+        return dumps_bytes(obj, indent, default).decode('utf-8')
+
+    return json.dumps(obj, indent=2 if indent else None, default=default)
+
+
+def loads(data: Any) -> Any:
+    """
+    Deserialize a JSON document.
+
+    Args:
+        data: JSON document as str, bytes, bytearray or memoryview
+
+    Returns:
+        Deserialized object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
@@ -4,16 +4,49 @@ ChainForgeLedger Logger Module
 Logging utilities for blockchain operations.
 """
 
+import atexit
 import logging
 import os
+import queue
 import sys
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Optional, Tuple
+
+
+# Loggers already configured by get_logger, keyed by (name, log_file, level)
+_LOGGER_CACHE: Dict[Tuple[str, Optional[str], int], logging.Logger] = {}
+
+# Background listeners writing queued records to log files
+_QUEUE_LISTENERS: Dict[str, QueueListener] = {}
+
+
+def _stop_queue_listeners():
+    """Flush and stop all background log file listeners."""
+    for listener in _QUEUE_LISTENERS.values():
+        listener.stop()
+    _QUEUE_LISTENERS.clear()
+
+
+atexit.register(_stop_queue_listeners)
+
+
+def _remove_handlers(logger: logging.Logger):
+    """Detach and close the handlers of a logger being reconfigured."""
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+        handler.close()
 
 
 def get_logger(name: str = __name__, log_file: str = None, level: int = logging.INFO):
     """
     Get a logger instance.
     
+    Loggers are configured once per (name, log_file, level); later calls
+    return the configured logger without rebuilding its handlers. File
+    output goes through a queue so the file write happens on a background
+    thread rather than in the caller.
+    
     Args:
         name: Logger name
         log_file: Log file path (None for console only)
@@ -22,22 +55,14 @@ def get_logger(name: str = __name__, log_file: str = None, level: int = logging.
     Returns:
         Logger instance
     """
+    cache_key = (name, log_file, level)
+    logger = _LOGGER_CACHE.get(cache_key)
+    if logger is not None:
+        return logger
+    
     logger = logging.getLogger(name)
     logger.setLevel(level)
-    logger.handlers.clear()
-    
-    # Console handler
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(level)
-    
-    # File handler (if log_file specified)
-    if log_file:
-        log_dir = os.path.dirname(log_file)
-        if log_dir and not os.path.exists(log_dir):
-            os.makedirs(log_dir, exist_ok=True)
-        
-        file_handler = logging.FileHandler(log_file, mode='a', encoding='utf-8')
-        file_handler.setLevel(level)
+    _remove_handlers(logger)
     
     # Create formatter
     formatter = logging.Formatter(
@@ -45,16 +70,39 @@ def get_logger(name: str = __name__, log_file: str = None, level: int = logging.
         datefmt='%Y-%m-%d %H:%M:%S'
     )
     
+    # Console handler
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setLevel(level)
     console_handler.setFormatter(formatter)
     logger.addHandler(console_handler)
     
+    # File handler (if log_file specified), fed through a queue
     if log_file:
-        file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        listener = _QUEUE_LISTENERS.get(log_file)
+        if listener is None:
+            log_dir = os.path.dirname(log_file)
+            if log_dir and not os.path.exists(log_dir):
+                os.makedirs(log_dir, exist_ok=True)
+            
+            file_handler = logging.FileHandler(log_file, mode='a', encoding='utf-8')
+            listener = QueueListener(queue.SimpleQueue(), file_handler)
+            listener.start()
+            _QUEUE_LISTENERS[log_file] = listener
+        
+        # Records are formatted before queueing; the file handler writes them as-is
+        queue_handler = QueueHandler(listener.queue)
+        queue_handler.setLevel(level)
+        queue_handler.setFormatter(formatter)
+        logger.addHandler(queue_handler)
     
     # Disable propagation
     logger.propagate = False
     
+    # Drop cache entries for this name configured with other settings
+    for key in [key for key in _LOGGER_CACHE if key[0] == name]:
+        del _LOGGER_CACHE[key]
+    _LOGGER_CACHE[cache_key] = logger
+    
     return logger
 
 
@@ -18,6 +18,7 @@ Components demonstrated:
 10. Tokenomics and Economic System
 """
 
+import sys
 import time
 import random
 from chainforgeledger import (
@@ -144,6 +145,7 @@ def demonstrate_blockchain_operations(platform):
     # Add transactions
     transactions = []
     wallet_names = list(platform['wallets'].keys())
+    added_lines = []
     for i in range(2):
         tx = Transaction(
             sender=platform['wallets'][wallet_names[i]].address,
@@ -151,13 +153,15 @@ def demonstrate_blockchain_operations(platform):
             amount=random.uniform(1, 100)
         )
         transactions.append(tx.to_dict())
-        print(f"✓ Added transaction: {tx.sender[:8]}... -> {tx.receiver[:8]}... ({tx.amount:.2f})")
+        added_lines.append(f"✓ Added transaction: {tx.sender[:8]}... -> {tx.receiver[:8]}... ({tx.amount:.2f})\n")
+    sys.stdout.write(''.join(added_lines))
+    sys.stdout.flush()
     
     # Mine a block
-    start_time = time.time()
+    start_time = time.perf_counter_ns()
     new_block = pow_consensus.mine_block(transactions, platform['wallets']['miner1'].address)
-    mining_time = time.time() - start_time
-    pow_chain.add_block(new_block)
+    mining_time = (time.perf_counter_ns() - start_time) / 1e9
+    pow_chain.add_block(new_block, trusted=True)
     
     print(f"✓ Block {new_block.index} mined in {mining_time:.2f} seconds")
     print(f"   Hash: {new_block.hash[:16]}...")
@@ -177,7 +181,7 @@ def demonstrate_wallet_operations(platform):
     
     print("1. Wallet Information:")
     for name, wallet in wallets.items():
-        print(f"   {name}: {wallet.address[:12]}... (Balance: {wallet.balance:.2f})")
+        print(f"   {name}: {wallet.short_address}... (Balance: {wallet.balance:.2f})")
     
     # Transfer funds between wallets
     print("\n2. Fund Transfers:")
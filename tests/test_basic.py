@@ -277,6 +277,26 @@ class TestChainForgeLedger(unittest.TestCase):
         client = LightClient()
         self.assertIsNotNone(client)
     
+    def test_light_client_merkle_proofs(self):
+        """Test LightClient incremental Merkle tree and proofs"""
+        import hashlib
+        from chainforgeledger.core.merkle import compute_root
+        
+        client = LightClient()
+        leaves = [hashlib.sha256(b"%d" % i).digest() for i in range(11)]
+        for count, leaf in enumerate(leaves, start=1):
+            self.assertEqual(client.add_leaf(leaf), count - 1)
+            self.assertEqual(client.get_merkle_root(), compute_root(b"".join(leaves[:count])))
+        
+        root = client.get_merkle_root()
+        for index, leaf in enumerate(leaves):
+            proof = client.generate_proof(index)
+            self.assertEqual(client.generate_proof(index), proof)
+            self.assertTrue(LightClient.verify_proof(leaf, index, proof, root))
+        self.assertFalse(LightClient.verify_proof(leaves[0], 1, client.generate_proof(1), root))
+        with self.assertRaises(ValueError):
+            client.generate_proof(len(leaves))
+    
     def test_block_header_creation(self):
         """Test BlockHeader creation"""
         header = BlockHeader(
@@ -298,6 +318,31 @@ class TestChainForgeLedger(unittest.TestCase):
         self.assertIsNotNone(pipeline)
         self.assertIsInstance(pipeline, ExecutionPipeline)
     
+    def test_execution_pipeline_plugin_hooks(self):
+        """Test ExecutionPipeline block hooks follow plugin changes"""
+        import asyncio
+        from types import SimpleNamespace
+        
+        calls = []
+        
+        class RecordingPlugin:
+            def __init__(self, name):
+                self.name = name
+            
+            async def pre_process_block(self, block, context):
+                calls.append(self.name)
+        
+        first = RecordingPlugin("first")
+        pipeline = create_execution_pipeline({'plugins': [first, object()]})
+        block = SimpleNamespace(hash="0" * 64, index=1, timestamp=0, validator=None, transactions=[])
+        
+        asyncio.run(pipeline.process_block(block))
+        pipeline.add_plugin(RecordingPlugin("second"))
+        asyncio.run(pipeline.process_block(block))
+        pipeline.remove_plugin(first)
+        asyncio.run(pipeline.process_block(block))
+        self.assertEqual(calls, ["first", "first", "second", "second"])
+    
     def test_pipeline_context_creation(self):
         """Test PipelineContext creation"""
         context = PipelineContext(block_hash="0"*64, block_number=1)
@@ -320,6 +365,17 @@ class TestChainForgeLedger(unittest.TestCase):
         """Test EventSystem creation"""
         events = EventSystem()
         self.assertIsNotNone(events)
+        
+        # History keeps the newest maxHistorySize events; batches dispatch in order
+        events = EventSystem({'maxHistorySize': 3})
+        received = []
+        events.subscribe('state.updated', lambda event: received.append(event.data['n']))
+        for n in range(4):
+            events.publish('state.updated', {'n': n})
+        events.publish_batch([('state.updated', {'n': 4}), ('state.updated', {'n': 5})])
+        self.assertEqual(received, [0, 1, 2, 3, 4, 5])
+        self.assertEqual([event.data['n'] for event in events.get_events()], [3, 4, 5])
+        self.assertEqual(len(events.get_events({'limit': 2})), 2)
     
     def test_event_creation(self):
         """Test Event creation"""
@@ -367,6 +423,86 @@ class TestChainForgeLedger(unittest.TestCase):
         state_machine = StateMachine()
         self.assertIsNotNone(state_machine)
     
+    def test_state_machine_apply_batch(self):
+        """Test StateMachine parallel verification and batched apply"""
+        import asyncio
+        from types import SimpleNamespace
+        
+        state_machine = StateMachine()
+        state_machine.state['accounts']['alice'] = {'balance': 100, 'nonce': 0, 'code': '', 'storage': {}}
+        
+        def transfer(sender, value, gas_limit=21000):
+            return SimpleNamespace(from_address=sender, to_address='bob', value=value, gas_limit=gas_limit)
+        
+        batch = [transfer('alice', 60), transfer('alice', 60), transfer('carol', 1), transfer('alice', 10, gas_limit=100)]
+        self.assertEqual(
+            state_machine.verify_transactions_parallel(batch),
+            [None, None, "Sender account not found", "Gas limit too low"]
+        )
+        with self.assertRaises(TypeError):
+            state_machine.freeze()['mallory'] = {}
+        
+        results = asyncio.run(state_machine.apply_batch(batch))
+        self.assertEqual([result.success for result in results], [True, False, False, False])
+        self.assertEqual(results[1].error, "Insufficient balance")
+        self.assertEqual(results[0].state_root, state_machine.get_state_root())
+        self.assertEqual(state_machine.get_account('bob')['balance'], 60)
+
+        # Batches and single transactions share the write lock
+        async def race():
+            batch_results, single = await asyncio.gather(
+                state_machine.apply_batch([transfer('alice', 20), transfer('alice', 20)]),
+                state_machine.apply_transaction(transfer('alice', 20))
+            )
+            return [result.success for result in batch_results] + [single.success]
+
+        self.assertEqual(sorted(asyncio.run(race())), [False, True, True])
+        self.assertEqual(state_machine.get_account('alice')['balance'], 0)
+
+        # Senders funded or created earlier in the batch see the new balance
+        state_machine.state['accounts']['alice']['balance'] = 50
+        chained = [
+            SimpleNamespace(from_address='alice', to_address='dave', value=30, gas_limit=21000),
+            SimpleNamespace(from_address='dave', to_address='erin', value=20, gas_limit=21000),
+            SimpleNamespace(from_address='bob', to_address='alice', value=60, gas_limit=21000),
+            SimpleNamespace(from_address='alice', to_address='erin', value=70, gas_limit=21000),
+        ]
+        results = asyncio.run(state_machine.apply_batch(chained))
+        self.assertEqual([result.success for result in results], [True, True, True, True])
+        self.assertEqual(state_machine.get_account('erin')['balance'], 90)
+        self.assertEqual(state_machine.get_account('alice')['balance'], 10)
+
+    def test_shared_executor_pool(self):
+        """Test the shared verification pool can be resized"""
+        from chainforgeledger.runtime.executor import configure_pool, get_pool, get_pool_size
+        
+        pool = configure_pool(2)
+        self.assertIs(get_pool(), pool)
+        self.assertEqual(get_pool_size(), 2)
+        self.assertEqual(list(pool.map(abs, [-1, -2])), [1, 2])
+        configure_pool()
+        self.assertIsNot(get_pool(), pool)
+
+        # Concurrent first use creates exactly one pool
+        import threading
+        from chainforgeledger.runtime import executor
+        previous, executor._POOL = executor._POOL, None
+        barrier = threading.Barrier(8)
+        pools = []
+
+        def first_use():
+            barrier.wait()
+            pools.append(get_pool())
+
+        threads = [threading.Thread(target=first_use) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(set(map(id, pools))), 1)
+        self.assertIs(get_pool(), pools[0])
+        previous.shutdown(wait=False)
+
     def test_state_snapshot_creation(self):
         """Test StateSnapshot creation"""
         snapshot = StateSnapshot(block_number=1, block_hash="0"*64, state_root="0"*64, timestamp=0)